@@ -19,7 +19,10 @@ import copy
 from datetime import datetime
 import threading
 from generator import Generator  # Uses python-docx to create the resume document
+from preview import preview  # Text-only preview, no python-docx
+from layout_estimate import estimate_pages
 from ai_selector import AISelector
+from offline_selector import OfflineSelector
 
 class ResumeGeneratorGUI:
     def __init__(self, root):
@@ -1199,6 +1202,8 @@ class ResumeGeneratorGUI:
         model_var = tk.StringVar(value=CLAUDE_MODELS[0])
         model_combo = ttk.Combobox(win, textvariable=model_var, values=CLAUDE_MODELS, width=45)
         model_combo.pack(anchor="w", padx=10)
+        offline_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(win, text="Offline (score locally, no AI)", variable=offline_var, style="Custom.TCheckbutton").pack(anchor="w", padx=10, pady=(4, 0))
 
         # --- Job Posting ---
         ttk.Label(win, text="Paste Job Posting:", style="Custom.TLabel").pack(anchor="w", padx=10, pady=(8, 0))
@@ -1215,6 +1220,7 @@ class ResumeGeneratorGUI:
         # --- Button ---
         def on_autoselect():
             model = model_var.get().strip() or None
+            offline = offline_var.get()
             job_posting = job_text.get("1.0", tk.END).strip()
 
             if not job_posting:
@@ -1226,32 +1232,17 @@ class ResumeGeneratorGUI:
             win.update_idletasks()
 
             def worker():
-                selector = AISelector(self.master_resume)
-                result, error = selector.call_with_retry(
-                    job_posting,
-                    model=model,
-                    on_progress=lambda msg: win.after(0, lambda m=msg: status_var.set(m))
-                )
-                if error:
-                    win.after(0, lambda: finish(result, error, None))
-                    return
-
-                # Round 2: reorder selected items
-                projects = selector._get_section_content("Technical Projects")
-                competencies = selector._get_section_content("Core Competencies")
-                selected_projects = [projects[i] for i in result["technical_project_indices"]]
-                selected_comps = [competencies[i] for i in result["core_competency_indices"]]
-
-                reorder, reorder_error = selector.call_reorder(
-                    job_posting, selected_projects, selected_comps,
-                    model=model,
-                    on_progress=lambda msg: win.after(0, lambda m=msg: status_var.set(m))
-                )
-                if reorder_error:
-                    # Proceed without reorder on failure
-                    win.after(0, lambda: finish(result, None, None))
-                else:
-                    win.after(0, lambda: finish(result, None, reorder))
+                try:
+                    selector = (OfflineSelector if offline else AISelector)(self.master_resume)
+                    result, reorder, error = selector.select(
+                        job_posting,
+                        model=model,
+                        on_progress=lambda msg: win.after(0, lambda m=msg: status_var.set(m))
+                    )
+                except Exception as e:
+                    # Always re-enable the button, whatever went wrong.
+                    result, reorder, error = None, None, f"Unexpected error \u2014 {e}"
+                win.after(0, lambda: finish(result, error, reorder))
 
             def finish(result, error, reorder):
                 btn.configure(state="normal")
@@ -1371,6 +1362,7 @@ class ResumeGeneratorGUI:
         entry = ttk.Entry(bottom_frame, textvariable=self.output_file_name_var, width=30)
         entry.pack(side="left", padx=5)
         entry.configure(font=("Arial", self.get_main_font_size()))
+        ttk.Button(bottom_frame, text="Preview", command=self.open_preview_window, style="Custom.TButton").pack(side="left", padx=10)
         ttk.Button(bottom_frame, text="Generate Resume", command=self.generate_resume, style="Custom.TButton").pack(side="left", padx=10)
 
     def _on_mousewheel(self, event):
@@ -1553,6 +1545,68 @@ class ResumeGeneratorGUI:
                 elif section_title not in ["Core Competencies", "Technical Projects"]:
                     var.set(True)
 
+    def collect_selected_sections(self):
+        """Build the selected_sections list for Generator from the current checkboxes and radio buttons."""
+        selected_sections = []
+        for section in self.master_resume:
+            if self.section_vars[section["title"]].get():
+                if section["title"] == "Personal Information":
+                    selected_sections.append({"title": section["title"], "content": section["content"]})
+                elif section["title"] == "Objective":
+                    if self.selected_objective.get() == "Custom":
+                        custom_text = self.custom_objective_text.get().strip()
+                        if custom_text:
+                            selected_sections.append({
+                                "title": section["title"],
+                                "content": [custom_text]
+                            })
+                    else:
+                        selected_objective = self.selected_objective.get()
+                        if selected_objective in section["content"]:
+                            selected_sections.append({
+                                "title": section["title"],
+                                "content": [selected_objective]
+                            })
+                else:
+                    # For other sections, filter by selected subsections
+                    selected_content = []
+                    for item in section["content"]:
+                        # Special handling for Education section
+                        if section["title"] == "Education" and isinstance(item, list) and item:
+                            key = str(item[0])  # Convert title to string for dictionary key
+                        elif isinstance(item, dict):
+                            key = item.get("subtitle", "No Title")
+                        else:
+                            key = str(item)
+                        if (section["title"], key) in self.subsection_vars:
+                            if self.subsection_vars[(section["title"], key)].get():
+                                selected_content.append(item)
+                    if selected_content:
+                        selected_sections.append({
+                            "title": section["title"],
+                            "content": selected_content
+                        })
+        return selected_sections
+
+    def open_preview_window(self):
+        """Show a text preview of the current selection without building a .docx."""
+        selected_sections = self.collect_selected_sections()
+        if not selected_sections:
+            messagebox.showerror("Error", "No sections selected. Please select at least one section.")
+            return
+
+        preview_window = tk.Toplevel(self.root)
+        preview_window.title("Resume Preview")
+        preview_window.geometry("900x700")
+        preview_text = tk.Text(preview_window, wrap="none", font=("Courier", 12))
+        scrollbar = ttk.Scrollbar(preview_window, command=preview_text.yview)
+        scrollbar.pack(side="right", fill="y")
+        preview_text.pack(fill="both", expand=True, padx=10, pady=10)
+        preview_text.configure(yscrollcommand=scrollbar.set)
+        preview_text.insert("1.0", preview(selected_sections))
+        preview_text.insert("end", f"\n[estimated {estimate_pages(selected_sections):.2f} pages]\n")
+        preview_text.configure(state="disabled")
+
     def generate_resume(self):
         """
         Generate the resume document and save it to the user's Documents folder.
@@ -1565,47 +1619,8 @@ class ResumeGeneratorGUI:
             if not os.path.exists(output_dir):
                 os.makedirs(output_dir)
 
-            # ... (rest of the code remains the same)
             # Collect selected sections
-            selected_sections = []
-            for section in self.master_resume:
-                if self.section_vars[section["title"]].get():
-                    if section["title"] == "Personal Information":
-                        selected_sections.append({"title": section["title"], "content": section["content"]})
-                    elif section["title"] == "Objective":
-                        if self.selected_objective.get() == "Custom":
-                            custom_text = self.custom_objective_text.get().strip()
-                            if custom_text:
-                                selected_sections.append({
-                                    "title": section["title"],
-                                    "content": [custom_text]
-                                })
-                        else:
-                            selected_objective = self.selected_objective.get()
-                            if selected_objective in section["content"]:
-                                selected_sections.append({
-                                    "title": section["title"],
-                                    "content": [selected_objective]
-                                })
-                    else:
-                        # For other sections, filter by selected subsections
-                        selected_content = []
-                        for item in section["content"]:
-                            # Special handling for Education section
-                            if section["title"] == "Education" and isinstance(item, list) and item:
-                                key = str(item[0])  # Convert title to string for dictionary key
-                            elif isinstance(item, dict):
-                                key = item.get("subtitle", "No Title")
-                            else:
-                                key = str(item)
-                            if (section["title"], key) in self.subsection_vars:
-                                if self.subsection_vars[(section["title"], key)].get():
-                                    selected_content.append(item)
-                        if selected_content:
-                            selected_sections.append({
-                                "title": section["title"],
-                                "content": selected_content
-                            })
+            selected_sections = self.collect_selected_sections()
 
             if not selected_sections:
                 messagebox.showerror("Error", "No sections selected. Please select at least one section.")
@@ -0,0 +1,206 @@
+# ai_backends.py
+"""
+Model backends for AISelector.
+
+A backend turns a prompt into streamed response text. It is any object with
+
+    async def stream(self, prompt, model=None, usage=None)
+
+an async iterator of text chunks. usage, when given, is a dict the backend
+fills with token counts (input_tokens, cache_read_input_tokens,
+cache_creation_input_tokens) as far as it knows them. AISelector closes
+the stream as soon as the response JSON is complete, so a backend must
+tolerate being closed early and should fill usage as soon as it knows the
+counts rather than only at the end of the stream.
+
+    AgentSDKBackend  Claude via the Agent SDK with subscription auth (default)
+    MockBackend      in-process stand-in for load tests and offline CI:
+                     valid or deliberately malformed replies with a
+                     configurable latency distribution and error rate
+
+Usage:
+    backend = MockBackend(latency=lognormal(0.8, 0.5), error_rate=0.02, malformed_rate=0.1)
+    selector = AISelector(master_resume, backend=backend)
+"""
+
+import asyncio
+import json
+import math
+import random
+import re
+
+# Token counts a backend reports through its usage dict.
+USAGE_FIELDS = ("input_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+# Section headers whose numbered items the mock backend reads from a prompt.
+_SELECTION_SECTIONS = ("Objective options", "Technical Project options", "Core Competency options")
+_REORDER_SECTIONS = ("SELECTED TECHNICAL PROJECTS", "SELECTED CORE COMPETENCIES")
+_NUMBERED_LINE = re.compile(r"^\d+: ")
+
+MALFORMED_KINDS = ("syntax", "repairable", "invalid")
+
+
+class AgentSDKBackend:
+    """Claude via the Agent SDK using subscription auth."""
+
+    async def stream(self, prompt, model=None, usage=None):
+        from claude_agent_sdk import query, ClaudeAgentOptions
+        streamed = False
+        messages = query(
+            prompt=prompt,
+            options=ClaudeAgentOptions(
+                allowed_tools=[],
+                thinking={"type": "adaptive"},
+                model=model,
+                include_partial_messages=True,
+            ),
+        )
+        try:
+            async for msg in messages:
+                event = getattr(msg, "event", None)
+                if isinstance(event, dict):
+                    delta = event.get("delta") or {}
+                    if event.get("type") == "message_start" and usage is not None:
+                        # Input token counts arrive up front, so they are known
+                        # even when the stream is closed at the closing brace.
+                        _fill_usage(usage, (event.get("message") or {}).get("usage"))
+                    elif event.get("type") == "content_block_delta" and delta.get("type") == "text_delta":
+                        streamed = True
+                        yield delta["text"]
+                elif hasattr(msg, "result"):
+                    if usage is not None:
+                        _fill_usage(usage, getattr(msg, "usage", None))
+                    if not streamed and msg.result:
+                        yield msg.result
+        finally:
+            aclose = getattr(messages, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+def _fill_usage(usage, reported):
+    """Copy the USAGE_FIELDS counts of a provider usage dict into usage."""
+    reported = reported or {}
+    for field in USAGE_FIELDS:
+        usage[field] = reported.get(field) or 0
+
+
+def constant(seconds):
+    """Latency distribution: always seconds."""
+    return lambda rng: seconds
+
+
+def uniform(low, high):
+    """Latency distribution: uniform between low and high seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median, sigma):
+    """Latency distribution: log-normal with the given median (seconds) and shape; long-tailed like real APIs."""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+class MockBackendError(RuntimeError):
+    pass
+
+
+class MockBackend:
+    def __init__(self, latency=constant(0.0), error_rate=0.0, malformed_rate=0.0,
+                 malformed_kinds=MALFORMED_KINDS, chunk_size=16, seed=None):
+        """
+        latency: callable(rng) returning the seconds before the first chunk,
+                 e.g. constant(0.5), uniform(0.2, 1.0) or lognormal(0.8, 0.5).
+        error_rate: probability a request raises MockBackendError.
+        malformed_rate: probability a reply is malformed, drawn evenly from
+                 malformed_kinds: "syntax" (truncated JSON), "repairable"
+                 (duplicates, too many projects, a string index) or
+                 "invalid" (an out-of-range objective or a missing list).
+        chunk_size: characters per streamed chunk.
+        seed: seed for reproducible runs.
+        """
+        unknown = set(malformed_kinds) - set(MALFORMED_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown malformed kind {sorted(unknown)[0]!r}; "
+                             f"expected one of: {', '.join(MALFORMED_KINDS)}")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.malformed_kinds = tuple(malformed_kinds)
+        self.chunk_size = max(1, chunk_size)
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.malformed = 0
+
+    async def stream(self, prompt, model=None, usage=None):
+        self.requests += 1
+        await asyncio.sleep(self.latency(self.rng))
+        if self.rng.random() < self.error_rate:
+            self.errors += 1
+            raise MockBackendError("mock backend error")
+        text = self.reply(prompt)
+        if usage is not None:
+            usage["input_tokens"] = len(prompt) // 4
+        for start in range(0, len(text), self.chunk_size):
+            yield text[start:start + self.chunk_size]
+
+    def reply(self, prompt):
+        """The response text for prompt: valid, or malformed at malformed_rate."""
+        reorder = "technical_project_order" in prompt
+        counts = _numbered_counts(prompt, _REORDER_SECTIONS if reorder else _SELECTION_SECTIONS)
+        response = self._reorder(*counts) if reorder else self._selection(*counts)
+        if self.malformed_kinds and self.rng.random() < self.malformed_rate:
+            self.malformed += 1
+            return self._malform(response, self.rng.choice(self.malformed_kinds), counts)
+        return json.dumps(response)
+
+    def _selection(self, objectives, projects, competencies):
+        rng = self.rng
+        return {
+            "objective_index": rng.randrange(max(1, objectives)),
+            "technical_project_indices": rng.sample(range(projects), min(projects, rng.randint(2, 4))),
+            "core_competency_indices": rng.sample(range(competencies), min(competencies, rng.randint(1, 12))),
+        }
+
+    def _reorder(self, projects, competencies):
+        return {
+            "technical_project_order": self.rng.sample(range(projects), projects),
+            "core_competency_order": self.rng.sample(range(competencies), competencies),
+        }
+
+    def _malform(self, response, kind, counts):
+        if kind == "syntax":
+            text = json.dumps(response)
+            return text[:self.rng.randrange(1, len(text))]
+        response = dict(response)
+        keys = list(response)
+        if kind == "repairable":
+            if "objective_index" in response:
+                response["objective_index"] = str(response["objective_index"])
+                response["technical_project_indices"] = response["technical_project_indices"] * 2
+            else:
+                key = self.rng.choice(keys)
+                response[key] = response[key][:-1]  # a partial permutation
+        else:  # invalid
+            if "objective_index" in response:
+                response["objective_index"] = counts[0] + 5
+            else:
+                del response[self.rng.choice(keys)]
+        return json.dumps(response)
+
+
+def _numbered_counts(prompt, headers):
+    """Number of "N: item" lines directly below each header in prompt."""
+    counts = []
+    lines = prompt.splitlines()
+    for header in headers:
+        count = 0
+        for i, line in enumerate(lines):
+            if line.startswith(header):
+                for item in lines[i + 1:]:
+                    if not _NUMBERED_LINE.match(item):
+                        break
+                    count += 1
+                break
+        counts.append(count)
+    return counts
@@ -0,0 +1,114 @@
+# ai_cache.py
+"""
+Persistent cache of validated AISelector responses.
+
+A job posting that was already processed against an unchanged master resume
+is answered from disk instead of the model. Entries are keyed on the
+whitespace-normalized job posting, a hash of the master resume, the model
+name, the prompt-template version and any further prompt input (the items
+being reordered, or the pre-ranked candidates offered to the model). They
+expire after a TTL and are evicted least-recently-used first once the cache
+outgrows max_bytes.
+
+Usage:
+    cache = ResponseCache("~/.cache/resume-generator/ai")
+    selector = AISelector(master_resume, cache=cache)
+    result, error = selector.call_with_retry(job_posting)
+    print(cache.stats())
+"""
+
+import json
+import os
+import time
+
+from render_cache import RenderCache, stable_hash
+
+DEFAULT_TTL = 30 * 24 * 60 * 60  # 30 days
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def normalize_posting(job_posting):
+    """Collapse whitespace so reformatted copies of a posting share a cache entry."""
+    return " ".join(job_posting.split())
+
+
+def response_key(kind, job_posting, master_hash, model, prompt_version, extra=None):
+    """
+    Cache key for one AI call.
+
+    kind: "autoselect", "reorder" or "select_and_order".
+    extra: any further prompt input, e.g. the items a reorder call sorts or
+           the pre-ranked candidate indices.
+    """
+    return stable_hash({
+        "kind": kind,
+        "posting": normalize_posting(job_posting),
+        "master": master_hash,
+        "model": model,
+        "prompt_version": prompt_version,
+        "extra": extra,
+    })
+
+
+class ResponseCache(RenderCache):
+    SUFFIX = ".json"
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        """
+        directory: where cached responses live (created if missing).
+        max_bytes: total size the cache may occupy before LRU eviction.
+        ttl: seconds a response stays valid after it was stored; None keeps
+             entries until they are evicted.
+        """
+        super().__init__(directory, max_bytes=max_bytes)
+        self.ttl = ttl
+        self.expired = 0
+
+    def __getstate__(self):
+        return {"directory": self.directory, "max_bytes": self.max_bytes, "ttl": self.ttl}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"], state["max_bytes"], state["ttl"])
+
+    def get_response(self, key):
+        """Return the cached response for key, or None if missing, expired or unreadable."""
+        data = self.get(key)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data)
+            stored_at = entry["stored_at"]
+            response = entry["response"]
+        except (ValueError, KeyError, TypeError):
+            self._discard(key)
+            return None
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            self._discard(key, expired=True)
+            return None
+        return response
+
+    def put_response(self, key, response):
+        """Store a validated response under key."""
+        entry = {"stored_at": time.time(), "response": response}
+        self.put(key, json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+    def _discard(self, key, expired=False):
+        # get() counted a hit; an unusable entry is a miss.
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._forget(key)
+            self.hits -= 1
+            self.misses += 1
+            if expired:
+                self.expired += 1
+
+    def stats(self):
+        """Return hit/miss/expiry/eviction counters and current size as a dict."""
+        stats = super().stats()
+        with self._lock:
+            stats["expired"] = self.expired
+        stats["ttl"] = self.ttl
+        return stats
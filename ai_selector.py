@@ -3,16 +3,172 @@
 ai_selector.py
 
 Shared AI selection logic used by both the GUI (ResumeBuilder.py) and the
-CLI (resume_cli.py). Uses the Claude Agent SDK with subscription auth.
+CLI (resume_cli.py). Uses the Claude Agent SDK with subscription auth by
+default; any backend from ai_backends.py can stand in for it.
+
+Every call has an async form (acall_with_retry, acall_reorder, aselect, ...)
+that runs on the caller's event loop; the sync methods wrap them in a single
+asyncio.run(). select_many() processes a batch of postings concurrently on
+one loop.
 """
 
 import asyncio
+import contextvars
 import json
+import math
+import time
+from collections import Counter, OrderedDict
+from contextlib import nullcontext
+
+from ai_backends import AgentSDKBackend, USAGE_FIELDS
+from ai_cache import response_key
+from prerank import BM25Ranker
+from render_cache import stable_hash
+from stream_json import StreamingJSONObject
+
+# Bump whenever a prompt template or the expected response format changes,
+# so cached responses from older prompts are never reused.
+PROMPT_VERSION = 2
+
+# Model requests select_many keeps in flight at once.
+DEFAULT_CONCURRENCY = 4
+
+# Semaphore that aselect_many sets for the calls it makes; every backend
+# request holds it for the lifetime of its stream.
+_request_slots = contextvars.ContextVar("request_slots", default=None)
+
+# Sections AISelector(top_k=...) pre-ranks locally before prompting.
+PRERANKED_SECTIONS = ("Technical Projects", "Core Competencies")
+
+# Built selection-prompt prefixes, keyed by (master hash, kind, candidates);
+# shared by all selectors so each GUI run reuses them. Least recently used
+# entries are dropped beyond PREFIX_CACHE_SIZE.
+_PREFIX_CACHE = OrderedDict()
+PREFIX_CACHE_SIZE = 32
+
+# Counters reported by AISelector.prompt_stats(). The token fields are the
+# usage the Agent SDK reports for each call.
+PROMPT_STAT_FIELDS = (
+    "prompts", "prefix_chars", "fresh_chars", "prefix_builds", "prefix_hits",
+    "valid", "repaired", "rejected", "early_stops",
+    "input_tokens", "cache_read_input_tokens", "cache_creation_input_tokens",
+)
+
+# Seconds a hedged request waits before also launching the next model.
+DEFAULT_HEDGE_DELAY = 2.0
+
+# Static head of every reorder prompt; the selected items and the job
+# posting follow it.
+REORDER_INSTRUCTIONS = """You are a resume optimization assistant. Given already-selected resume items and a job posting (at the end of this prompt), determine the best ordering so the most relevant items appear first.
+
+INSTRUCTIONS:
+- Return ONLY valid JSON with no markdown, no code fences, no explanation.
+- Each list must contain ALL of the indices shown below, rearranged into the best order (most relevant to the job posting first).
+- Do not add or remove any indices — just reorder them.
+
+Return this exact JSON structure:
+{
+  "technical_project_order": [0, 1],
+  "core_competency_order": [0, 1, 2]
+}
+
+"""
+
+
+def _as_index(value):
+    """value as an int index (accepting "3" and 3.0), or None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+def _clean_indices(values, size):
+    """Valid indices below size from values, deduplicated, in their given order."""
+    if not isinstance(values, list):
+        return None
+    seen = []
+    for value in values:
+        index = _as_index(value)
+        if index is not None and 0 <= index < size and index not in seen:
+            seen.append(index)
+    return seen
+
+
+async def _aclose(stream):
+    """Close an async generator stream; plain async iterators have nothing to close."""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list; None if it is empty."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
 
 
 class AISelector:
-    def __init__(self, master_resume: list):
+    def __init__(self, master_resume: list, cache=None, top_k=None, hedge_models=None,
+                 hedge_delay=DEFAULT_HEDGE_DELAY, backend=None):
+        """
+        master_resume: the full resume data (list of sections).
+        cache: optional ai_cache.ResponseCache; validated responses are then
+               reused for the same posting, master resume, model and prompts.
+        top_k: send only the top_k Technical Projects and Core Competencies
+               by local BM25 score against the posting (see prerank.py) to
+               the selection prompts; None sends every item. Results always
+               use indices into the full master resume sections.
+        hedge_models: optional list of models, fastest first (e.g.
+               ["haiku", "sonnet"]). Each request goes to the first model
+               at once and to the next one every hedge_delay seconds (or
+               as soon as all running requests failed); the first response
+               that validates wins and the others are cancelled. The model
+               argument of the call methods is then ignored. In
+               select_many each hedged launch counts against concurrency.
+        hedge_delay: seconds between hedged launches; 0 sends to all
+               models in parallel.
+        backend: where prompts go (see ai_backends.py); defaults to
+               AgentSDKBackend. ai_backends.MockBackend runs without a model.
+        """
+        if top_k is not None and top_k < 2:
+            raise ValueError(f"top_k must be at least 2 (got {top_k})")
+        if hedge_delay < 0:
+            raise ValueError(f"hedge_delay must not be negative (got {hedge_delay})")
         self.master_resume = master_resume
+        self.cache = cache
+        self.backend = backend if backend is not None else AgentSDKBackend()
+        self.top_k = top_k
+        self._master_hash = None
+        self._rankers = {}
+        self._prompt_counts = dict.fromkeys(PROMPT_STAT_FIELDS, 0)
+        self.hedge_models = list(hedge_models) if hedge_models else None
+        self.hedge_delay = hedge_delay
+        self._latencies = []
+        self._winners = Counter()
+
+    def _cache_key(self, kind, job_posting, model, extra=None):
+        if self.hedge_models:
+            model = "hedge:" + "+".join(self.hedge_models)
+        if self._master_hash is None:
+            self._master_hash = stable_hash(self.master_resume)
+        return response_key(kind, job_posting, self._master_hash, model, PROMPT_VERSION, extra)
+
+    def _cached_response(self, key, validate):
+        """Return a cached response that still validates, or None."""
+        if self.cache is None:
+            return None
+        parsed = self.cache.get_response(key)
+        if parsed is None or validate(parsed):
+            return None
+        return parsed
 
     def _get_section_content(self, title):
         for section in self.master_resume:
@@ -20,17 +176,78 @@ class AISelector:
                 return section.get("content", [])
         return []
 
-    def _build_autoselect_prompt(self, job_posting):
+    def _candidates(self, job_posting):
+        """
+        Original indices of the pre-ranked items to offer the model, as
+        {section title: [index, ...]} for each section top_k shortens, or
+        None when every item is sent.
+        """
+        if self.top_k is None:
+            return None
+        candidates = {}
+        for title in PRERANKED_SECTIONS:
+            content = self._get_section_content(title)
+            if len(content) <= self.top_k:
+                continue
+            if title not in self._rankers:
+                self._rankers[title] = BM25Ranker(content)
+            candidates[title] = self._rankers[title].top_k(job_posting, self.top_k)
+        return candidates or None
+
+    def _prompt_items(self, title, candidates=None):
+        """The items of a section as numbered in the prompt."""
+        content = self._get_section_content(title)
+        if candidates and title in candidates:
+            return [content[i] for i in candidates[title]]
+        return content
+
+    @staticmethod
+    def _identity_reorder(result):
+        """A reorder dict that keeps a selection in its current order."""
+        return {
+            "technical_project_order": list(range(len(result["technical_project_indices"]))),
+            "core_competency_order": list(range(len(result["core_competency_indices"]))),
+        }
+
+    def _to_master_indices(self, parsed, candidates):
+        """Map prompt-relative indices in a selection back to the master resume."""
+        if not candidates:
+            return parsed
+        result = dict(parsed)
+        for key, title in (("technical_project_indices", "Technical Projects"),
+                           ("core_competency_indices", "Core Competencies")):
+            if title in candidates:
+                result[key] = [candidates[title][i] for i in parsed[key]]
+        return result
+
+    def _build_selection_prefix(self, kind, candidates=None):
         objectives = self._get_section_content("Objective")
-        projects = self._get_section_content("Technical Projects")
-        competencies = self._get_section_content("Core Competencies")
+        projects = self._prompt_items("Technical Projects", candidates)
+        competencies = self._prompt_items("Core Competencies", candidates)
 
         numbered = lambda items: "\n".join(f"{i}: {v}" for i, v in enumerate(items))
 
-        return f"""You are a resume optimization assistant. Given a job posting and a candidate's resume data, select the best matching items by their index numbers.
+        if kind == "select_and_order":
+            task = ("select the best matching items by their index numbers and order them so the most "
+                    "relevant items appear first.")
+            ordering = """
+- List the selected projects and competencies in order of relevance to the job posting, most relevant first — not in index order.
+- Do not repeat an index within a list."""
+            example = """{
+  "objective_index": 0,
+  "technical_project_indices": [1, 0],
+  "core_competency_indices": [2, 0, 1]
+}"""
+        else:
+            task = "select the best matching items by their index numbers."
+            ordering = ""
+            example = """{
+  "objective_index": 0,
+  "technical_project_indices": [0, 1],
+  "core_competency_indices": [0, 1, 2]
+}"""
 
-JOB POSTING:
-{job_posting}
+        return f"""You are a resume optimization assistant. Given a candidate's resume data and a job posting (at the end of this prompt), {task}
 
 CANDIDATE DATA:
 Objective options (select exactly ONE — provide its index):
@@ -47,39 +264,55 @@ INSTRUCTIONS:
 - Use the integer index numbers shown above — do not include the text.
 - Select exactly one objective (a single integer).
 - Select between 2 and 4 technical projects (a list of integers).
-- Select all relevant core competencies (a list of integers).
+- Select all relevant core competencies (a list of integers).{ordering}
 
 Return this exact JSON structure:
-{{
-  "objective_index": 0,
-  "technical_project_indices": [0, 1],
-  "core_competency_indices": [0, 1, 2]
-}}"""
+{example}
 
-    def _build_reorder_prompt(self, job_posting, selected_projects, selected_competencies):
-        numbered = lambda items: "\n".join(f"{i}: {v}" for i, v in enumerate(items))
+"""
 
-        return f"""You are a resume optimization assistant. Given a job posting and already-selected resume items, determine the best ordering so the most relevant items appear first.
+    def _prompt_prefix(self, kind, candidates=None):
+        """
+        The static part of a selection prompt: instructions and numbered
+        master resume items, byte-identical for every posting so the
+        provider's prompt-prefix cache can reuse it. Built once per master
+        resume hash, kind and candidate set.
+        """
+        if self._master_hash is None:
+            self._master_hash = stable_hash(self.master_resume)
+        key = (self._master_hash, kind, stable_hash(candidates) if candidates else None)
+        prefix = _PREFIX_CACHE.get(key)
+        if prefix is None:
+            self._prompt_counts["prefix_builds"] += 1
+            prefix = self._build_selection_prefix(kind, candidates)
+            _PREFIX_CACHE[key] = prefix
+            while len(_PREFIX_CACHE) > PREFIX_CACHE_SIZE:
+                _PREFIX_CACHE.popitem(last=False)
+        else:
+            self._prompt_counts["prefix_hits"] += 1
+            _PREFIX_CACHE.move_to_end(key)
+        return prefix
+
+    def _build_autoselect_prompt(self, job_posting, candidates=None):
+        """Returns (prefix, suffix); the job posting is the only part after the prefix."""
+        return self._prompt_prefix("autoselect", candidates), f"JOB POSTING:\n{job_posting}"
+
+    def _build_select_and_order_prompt(self, job_posting, candidates=None):
+        """Returns (prefix, suffix); the job posting is the only part after the prefix."""
+        return self._prompt_prefix("select_and_order", candidates), f"JOB POSTING:\n{job_posting}"
 
-JOB POSTING:
-{job_posting}
+    def _build_reorder_prompt(self, job_posting, selected_projects, selected_competencies):
+        """Returns (prefix, suffix); the prefix is the fixed REORDER_INSTRUCTIONS."""
+        numbered = lambda items: "\n".join(f"{i}: {v}" for i, v in enumerate(items))
 
-SELECTED TECHNICAL PROJECTS (reorder these):
+        return REORDER_INSTRUCTIONS, f"""SELECTED TECHNICAL PROJECTS (reorder these):
 {numbered(selected_projects)}
 
 SELECTED CORE COMPETENCIES (reorder these):
 {numbered(selected_competencies)}
 
-INSTRUCTIONS:
-- Return ONLY valid JSON with no markdown, no code fences, no explanation.
-- Each list must contain ALL of the indices shown above, rearranged into the best order (most relevant to the job posting first).
-- Do not add or remove any indices — just reorder them.
-
-Return this exact JSON structure:
-{{
-  "technical_project_order": [0, 1],
-  "core_competency_order": [0, 1, 2]
-}}"""
+JOB POSTING:
+{job_posting}"""
 
     def _validate_reorder_response(self, parsed, num_projects, num_competencies):
         if not isinstance(parsed, dict):
@@ -98,7 +331,7 @@ Return this exact JSON structure:
 
         return None  # valid
 
-    def _validate_ai_response(self, parsed):
+    def _validate_ai_response(self, parsed, candidates=None):
         if not isinstance(parsed, dict):
             return "Response is not a JSON object."
 
@@ -114,7 +347,7 @@ Return this exact JSON structure:
             return "'technical_project_indices' must be a list."
         if not (2 <= len(parsed["technical_project_indices"]) <= 4):
             return f"'technical_project_indices' must have 2\u20134 items (got {len(parsed['technical_project_indices'])})."
-        projects = self._get_section_content("Technical Projects")
+        projects = self._prompt_items("Technical Projects", candidates)
         for idx in parsed["technical_project_indices"]:
             if not isinstance(idx, int) or not (0 <= idx < len(projects)):
                 return f"technical_project_indices contains invalid index: {idx}"
@@ -124,72 +357,404 @@ Return this exact JSON structure:
             return "'core_competency_indices' must be a list."
         if len(parsed["core_competency_indices"]) == 0:
             return "'core_competency_indices' must not be empty."
-        competencies = self._get_section_content("Core Competencies")
+        competencies = self._prompt_items("Core Competencies", candidates)
         for idx in parsed["core_competency_indices"]:
             if not isinstance(idx, int) or not (0 <= idx < len(competencies)):
                 return f"core_competency_indices contains invalid index: {idx}"
 
         return None  # valid
 
-    async def _call_claude(self, prompt, model=None):
-        """Call Claude via the Agent SDK using subscription auth."""
-        from claude_agent_sdk import query, ClaudeAgentOptions
-        result = ""
-        async for msg in query(
-            prompt=prompt,
-            options=ClaudeAgentOptions(
-                allowed_tools=[],
-                thinking={"type": "adaptive"},
-                model=model,
-            ),
-        ):
-            if hasattr(msg, "result"):
-                result = msg.result
-        return result
-
-    def _call_claude_sync(self, prompt, model=None):
-        """Sync wrapper around the async Agent SDK call."""
-        return asyncio.run(self._call_claude(prompt, model=model))
+    def _validate_select_and_order_response(self, parsed, candidates=None):
+        validation_error = self._validate_ai_response(parsed, candidates)
+        if validation_error:
+            return validation_error
+        # The lists double as the ordering, so each index may appear only once.
+        for key in ("technical_project_indices", "core_competency_indices"):
+            if len(set(parsed[key])) != len(parsed[key]):
+                return f"'{key}' must not repeat an index."
+        return None  # valid
 
-    def call_with_retry(self, job_posting, model=None, on_progress=None):
+    def _repair_ai_response(self, parsed, candidates=None):
         """
-        Call Claude via the Agent SDK, retrying up to 3 times on failure.
+        Deterministically fix a near-valid selection: coerce index types,
+        drop out-of-range and repeated indices and keep at most 4 projects.
+        Returns the repaired dict, or None when nothing usable is left
+        (no valid objective, fewer than 2 projects or no competencies).
+        """
+        if not isinstance(parsed, dict):
+            return None
+        objective = parsed.get("objective_index")
+        if isinstance(objective, list) and len(objective) == 1:
+            objective = objective[0]
+        objective = _as_index(objective)
+        if objective is None or not (0 <= objective < len(self._get_section_content("Objective"))):
+            return None
+        projects = _clean_indices(parsed.get("technical_project_indices"),
+                                  len(self._prompt_items("Technical Projects", candidates)))
+        competencies = _clean_indices(parsed.get("core_competency_indices"),
+                                      len(self._prompt_items("Core Competencies", candidates)))
+        if projects is None or len(projects) < 2 or not competencies:
+            return None
+        return {
+            "objective_index": objective,
+            "technical_project_indices": projects[:4],
+            "core_competency_indices": competencies,
+        }
+
+    def _repair_reorder_response(self, parsed, num_projects, num_competencies):
+        """
+        Deterministically complete a near-valid reorder: coerce index types,
+        drop out-of-range and repeated indices, then append any missing
+        indices in their original order. Returns None if a list is absent.
+        """
+        if not isinstance(parsed, dict):
+            return None
+        repaired = {}
+        for key, expected_len in [
+            ("technical_project_order", num_projects),
+            ("core_competency_order", num_competencies),
+        ]:
+            order = _clean_indices(parsed.get(key), expected_len)
+            if order is None:
+                return None
+            repaired[key] = order + [i for i in range(expected_len) if i not in order]
+        return repaired
 
-        on_progress: optional callable(str) for status messages.
-                     GUI passes a lambda that updates a status label;
-                     CLI passes print (or None to suppress).
+    async def _call_claude(self, prompt, model=None, on_field=None):
+        """
+        Send prompt to the backend (Claude via the Agent SDK by default).
 
-        Returns (result_dict, None) on success, or (None, error_str) on failure.
+        The response is streamed and parsed as it arrives (stream_json.py).
+        on_field(key, value, fields) fires as each top-level JSON field
+        completes, and the stream is closed as soon as the object is
+        complete or can no longer become valid JSON. Returns the JSON object
+        text, or everything streamed when no complete object arrived.
+        """
+        parser = StreamingJSONObject(on_field=on_field)
+        streamed = []
+        usage = {}
+        stream = self.backend.stream(prompt, model=model, usage=usage)
+        try:
+            async for text in stream:
+                streamed.append(text)
+                parser.feed(text)
+                if parser.complete or parser.error:
+                    if parser.error or parser.trailing:
+                        self._prompt_counts["early_stops"] += 1
+                    break
+        finally:
+            await _aclose(stream)
+            for field in USAGE_FIELDS:
+                self._prompt_counts[field] += usage.get(field) or 0
+        return parser.text if parser.complete else "".join(streamed)
+
+    def _partial_selection(self, fields, candidates=None):
+        """
+        The usable part of a selection that is still streaming: the fields
+        decoded so far, mapped to master resume indices, invalid entries
+        dropped.
+        """
+        partial = {}
+        objective = _as_index(fields.get("objective_index"))
+        if objective is not None and 0 <= objective < len(self._get_section_content("Objective")):
+            partial["objective_index"] = objective
+        for key, title in (("technical_project_indices", "Technical Projects"),
+                           ("core_competency_indices", "Core Competencies")):
+            indices = _clean_indices(fields.get(key), len(self._prompt_items(title, candidates)))
+            if indices is not None:
+                if candidates and title in candidates:
+                    indices = [candidates[title][i] for i in indices]
+                partial[key] = indices
+        return partial
+
+    def _selection_field_callback(self, on_partial, candidates=None):
+        """Adapt on_partial(partial_selection) to the stream parser's on_field."""
+        if on_partial is None:
+            return None
+
+        def on_field(key, value, fields):
+            if key in ("objective_index", "technical_project_indices", "core_competency_indices"):
+                on_partial(self._partial_selection(fields, candidates))
+        return on_field
+
+    def prompt_stats(self):
         """
-        prompt = self._build_autoselect_prompt(job_posting)
+        Prompt and response counters for this selector, as a dict.
+
+        prompts: prompts sent (every attempt counts).
+        prefix_chars / fresh_chars: characters sent in the cacheable static
+            prefix versus the per-call part (job posting, reorder items).
+        prefix_builds / prefix_hits: prefix strings built versus reused.
+        valid / repaired / rejected: responses that validated as sent, were
+            fixed locally by the repair stage (a round trip saved), or
+            needed another attempt.
+        early_stops: streams closed while the reply was still going: text
+            followed the complete JSON object, or the text could no longer
+            become valid JSON.
+        input_tokens, cache_read_input_tokens, cache_creation_input_tokens:
+            token usage reported by the backend, when available.
+        """
+        return dict(self._prompt_counts)
 
+    async def _request(self, prompt, model, validate, repair=None, on_field=None):
+        """
+        One model call with prompt = (prefix, suffix). A response that fails
+        validate is passed through repair (if given) and accepted when the
+        repaired version validates. on_field is passed to _call_claude.
+        Returns (parsed, None), or
+        (None, error_str) if the call failed or the response was unusable.
+        """
+        prefix, suffix = prompt
+        self._prompt_counts["prompts"] += 1
+        self._prompt_counts["prefix_chars"] += len(prefix)
+        self._prompt_counts["fresh_chars"] += len(suffix)
+        try:
+            slots = _request_slots.get()
+            async with slots if slots is not None else nullcontext():
+                raw_text = await self._call_claude(prefix + suffix, model=model, on_field=on_field)
+
+            # Strip markdown code fences if present
+            if raw_text.startswith("```"):
+                raw_text = raw_text.split("```")[1]
+                if raw_text.startswith("json"):
+                    raw_text = raw_text[4:]
+                raw_text = raw_text.strip()
+
+            parsed = json.loads(raw_text)
+            validation_error = validate(parsed)
+            if validation_error and repair is not None:
+                repaired = repair(parsed)
+                if repaired is not None and not validate(repaired):
+                    self._prompt_counts["repaired"] += 1
+                    return repaired, None
+        except (json.JSONDecodeError, KeyError) as e:
+            return None, f"Could not parse AI response \u2014 {e}"
+        except Exception as e:
+            return None, f"Unexpected error \u2014 {e}"
+        if validation_error:
+            self._prompt_counts["rejected"] += 1
+            return None, f"Invalid response \u2014 {validation_error}"
+        self._prompt_counts["valid"] += 1
+        return parsed, None
+
+    async def _hedged_request(self, prompt, validate, repair=None, on_field=None):
+        """
+        Race prompt across hedge_models, launching one every hedge_delay
+        seconds. Returns (parsed, winning_model, None), or
+        (None, None, error_str) when every model failed.
+        """
+        waiting = list(self.hedge_models)
+        running = {}
         last_error = None
-        for attempt in range(1, 4):
-            if on_progress:
-                on_progress(f"Contacting AI... (attempt {attempt} of 3)")
-            try:
-                raw_text = self._call_claude_sync(prompt, model=model)
-
-                # Strip markdown code fences if present
-                if raw_text.startswith("```"):
-                    raw_text = raw_text.split("```")[1]
-                    if raw_text.startswith("json"):
-                        raw_text = raw_text[4:]
-                    raw_text = raw_text.strip()
-
-                parsed = json.loads(raw_text)
-                validation_error = self._validate_ai_response(parsed)
-                if validation_error:
-                    last_error = f"Attempt {attempt}: Invalid response \u2014 {validation_error}"
+        timed_out = False
+        try:
+            while waiting or running:
+                # Launch the next model when the delay expired or nothing is left running.
+                if waiting and (timed_out or not running):
+                    model = waiting.pop(0)
+                    running[asyncio.ensure_future(self._request(prompt, model, validate, repair, on_field))] = model
+                timeout = self.hedge_delay if waiting else None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                timed_out = not done
+                for task in done:
+                    model = running.pop(task)
+                    parsed, error = task.result()
+                    if error is None:
+                        return parsed, model, None
+                    last_error = f"{model}: {error}"
+            return None, None, last_error
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _acall_validated(self, key, prompt, validate, model, on_progress, status, failure,
+                               repair=None, on_field=None):
+        """
+        Send prompt up to 3 times until a response parses and validates,
+        hedged across hedge_models when they are set.
+
+        key: cache key the validated response is stored under.
+        prompt: (prefix, suffix) as returned by the _build_*_prompt methods.
+        status: progress message prefix, e.g. "Contacting AI...".
+        failure: error message prefix once all attempts failed.
+        repair: optional callable(parsed) returning a fixed response or
+                None; a response it repairs needs no further attempt.
+        on_field: optional streaming callback, see _call_claude.
+
+        Returns (parsed, None) on success, or (None, error_str) on failure.
+        """
+        start = time.perf_counter()
+        last_error = None
+        try:
+            for attempt in range(1, 4):
+                if on_progress:
+                    on_progress(f"{status} (attempt {attempt} of 3)")
+                if self.hedge_models:
+                    parsed, winner, error = await self._hedged_request(prompt, validate, repair, on_field)
+                else:
+                    winner = model
+                    parsed, error = await self._request(prompt, model, validate, repair, on_field)
+                if error:
+                    last_error = f"Attempt {attempt}: {error}"
                     continue
+                self._winners[winner or "default"] += 1
+                if self.cache is not None:
+                    self.cache.put_response(key, parsed)
                 return parsed, None
+        finally:
+            self._latencies.append((time.perf_counter() - start) * 1000)
+
+        return None, f"{failure} after 3 attempts.\n\nLast error: {last_error}"
+
+    def latency_stats(self):
+        """
+        End-to-end latency of the model calls this selector made (retries
+        and hedging included; cache hits excluded), as a dict:
+        {"calls", "p50_ms", "p95_ms", "p99_ms", "max_ms", "winners"}.
+        winners counts which model answered each successful call.
+        """
+        latencies = sorted(self._latencies)
+        stats = {"calls": len(latencies), "winners": dict(self._winners)}
+        for pct in (50, 95, 99):
+            stats[f"p{pct}_ms"] = percentile(latencies, pct)
+        stats["max_ms"] = latencies[-1] if latencies else None
+        return stats
+
+    async def acall_with_retry(self, job_posting, model=None, on_progress=None, on_partial=None):
+        """Async call_with_retry; runs on the caller's event loop."""
+        candidates = self._candidates(job_posting)
+        validate = lambda parsed: self._validate_ai_response(parsed, candidates)
+        key = self._cache_key("autoselect", job_posting, model, extra=candidates)
+        cached = self._cached_response(key, validate)
+        if cached is not None:
+            if on_progress:
+                on_progress("Using cached AI selection.")
+            return self._to_master_indices(cached, candidates), None
+
+        prompt = self._build_autoselect_prompt(job_posting, candidates)
+        repair = lambda parsed: self._repair_ai_response(parsed, candidates)
+        on_field = self._selection_field_callback(on_partial, candidates)
+        result, error = await self._acall_validated(key, prompt, validate, model, on_progress,
+                                                    "Contacting AI...", "AI Auto-Select failed", repair,
+                                                    on_field)
+        return (None, error) if error else (self._to_master_indices(result, candidates), None)
+
+    async def acall_reorder(self, job_posting, selected_projects, selected_competencies, model=None,
+                            on_progress=None):
+        """Async call_reorder; runs on the caller's event loop."""
+        validate = lambda parsed: self._validate_reorder_response(
+            parsed, len(selected_projects), len(selected_competencies))
+        key = self._cache_key("reorder", job_posting, model,
+                              extra=[selected_projects, selected_competencies])
+        cached = self._cached_response(key, validate)
+        if cached is not None:
+            if on_progress:
+                on_progress("Using cached AI ordering.")
+            return cached, None
+
+        prompt = self._build_reorder_prompt(job_posting, selected_projects, selected_competencies)
+        repair = lambda parsed: self._repair_reorder_response(
+            parsed, len(selected_projects), len(selected_competencies))
+        return await self._acall_validated(key, prompt, validate, model, on_progress,
+                                           "Reordering selections...", "AI reorder failed", repair)
+
+    async def acall_select_and_order(self, job_posting, model=None, on_progress=None, on_partial=None):
+        """Async call_select_and_order; runs on the caller's event loop."""
+        candidates = self._candidates(job_posting)
+        validate = lambda parsed: self._validate_select_and_order_response(parsed, candidates)
+        key = self._cache_key("select_and_order", job_posting, model, extra=candidates)
+        cached = self._cached_response(key, validate)
+        if cached is not None:
+            if on_progress:
+                on_progress("Using cached AI selection.")
+            return self._to_master_indices(cached, candidates), None
+
+        prompt = self._build_select_and_order_prompt(job_posting, candidates)
+        repair = lambda parsed: self._repair_ai_response(parsed, candidates)
+        on_field = self._selection_field_callback(on_partial, candidates)
+        result, error = await self._acall_validated(key, prompt, validate, model, on_progress,
+                                                    "Contacting AI...", "AI Auto-Select failed", repair,
+                                                    on_field)
+        return (None, error) if error else (self._to_master_indices(result, candidates), None)
+
+    async def aselect(self, job_posting, model=None, on_progress=None, single_round=True, on_partial=None):
+        """Async select; runs on the caller's event loop."""
+        if single_round:
+            result, error = await self.acall_select_and_order(job_posting, model=model, on_progress=on_progress,
+                                                             on_partial=on_partial)
+            if not error:
+                return result, self._identity_reorder(result), None
+            if on_progress:
+                on_progress("Single-round selection failed; falling back to select then reorder.")
+
+        result, error = await self.acall_with_retry(job_posting, model=model, on_progress=on_progress,
+                                                   on_partial=on_partial)
+        if error:
+            return None, None, error
 
-            except (json.JSONDecodeError, KeyError) as e:
-                last_error = f"Attempt {attempt}: Could not parse AI response \u2014 {e}"
-            except Exception as e:
-                last_error = f"Attempt {attempt}: Unexpected error \u2014 {e}"
+        projects = self._get_section_content("Technical Projects")
+        competencies = self._get_section_content("Core Competencies")
+        selected_projects = [projects[i] for i in result["technical_project_indices"]]
+        selected_comps = [competencies[i] for i in result["core_competency_indices"]]
 
-        return None, f"AI Auto-Select failed after 3 attempts.\n\nLast error: {last_error}"
+        reorder, reorder_error = await self.acall_reorder(
+            job_posting, selected_projects, selected_comps, model=model, on_progress=on_progress
+        )
+        if reorder_error:
+            if on_progress:
+                on_progress(f"Reorder warning: {reorder_error}\nProceeding with default order.")
+            return result, None, None
+        return result, reorder, None
+
+    async def aselect_many(self, postings, concurrency=DEFAULT_CONCURRENCY, model=None, on_progress=None,
+                           single_round=True):
+        """
+        Run aselect for every posting concurrently on the caller's event loop.
+
+        concurrency: model requests in flight at once across all postings.
+                     Each request holds its slot until its response stream
+                     is closed; with hedge_models set, every hedged launch
+                     is a request of its own, so a hedge waits for a free
+                     slot like any other request.
+        on_progress: optional callable(str); messages are prefixed with the
+                     posting's position, e.g. "[3/10] Contacting AI...".
+
+        Returns a list of (result_dict, reorder_dict, error_str) triples in
+        the order of postings, as select() returns them.
+        """
+        postings = list(postings)
+
+        async def run(i, job_posting):
+            progress = None
+            if on_progress:
+                progress = lambda msg: on_progress(f"[{i + 1}/{len(postings)}] {msg}")
+            return await self.aselect(job_posting, model=model, on_progress=progress,
+                                      single_round=single_round)
+
+        # The tasks gather creates inherit the semaphore through the context.
+        token = _request_slots.set(asyncio.Semaphore(max(1, concurrency)))
+        try:
+            return await asyncio.gather(*(run(i, p) for i, p in enumerate(postings)))
+        finally:
+            _request_slots.reset(token)
+
+    def call_with_retry(self, job_posting, model=None, on_progress=None, on_partial=None):
+        """
+        Call Claude via the Agent SDK, retrying up to 3 times on failure.
+
+        on_progress: optional callable(str) for status messages.
+                     GUI passes a lambda that updates a status label;
+                     CLI passes print (or None to suppress).
+        on_partial: optional callable(dict) called while the response
+                    streams in, with the selection fields decoded so far
+                    (master resume indices, invalid entries dropped), so
+                    work such as pre-rendering can start early. It may fire
+                    again on a retry.
+
+        Returns (result_dict, None) on success, or (None, error_str) on failure.
+        """
+        return asyncio.run(self.acall_with_retry(
+            job_posting, model=model, on_progress=on_progress, on_partial=on_partial))
 
     def call_reorder(self, job_posting, selected_projects, selected_competencies, model=None, on_progress=None):
         """
@@ -197,36 +762,60 @@ Return this exact JSON structure:
 
         Returns (reorder_dict, None) on success, or (None, error_str) on failure.
         """
-        prompt = self._build_reorder_prompt(job_posting, selected_projects, selected_competencies)
+        return asyncio.run(self.acall_reorder(
+            job_posting, selected_projects, selected_competencies, model=model, on_progress=on_progress))
 
-        last_error = None
-        for attempt in range(1, 4):
-            if on_progress:
-                on_progress(f"Reordering selections... (attempt {attempt} of 3)")
-            try:
-                raw_text = self._call_claude_sync(prompt, model=model)
-
-                if raw_text.startswith("```"):
-                    raw_text = raw_text.split("```")[1]
-                    if raw_text.startswith("json"):
-                        raw_text = raw_text[4:]
-                    raw_text = raw_text.strip()
-
-                parsed = json.loads(raw_text)
-                validation_error = self._validate_reorder_response(
-                    parsed, len(selected_projects), len(selected_competencies)
-                )
-                if validation_error:
-                    last_error = f"Attempt {attempt}: Invalid response \u2014 {validation_error}"
-                    continue
-                return parsed, None
+    def call_select_and_order(self, job_posting, model=None, on_progress=None, on_partial=None):
+        """
+        Single-round call: select items and order them by relevance in one prompt.
+
+        The index lists in the result are already in relevance order, so the
+        separate call_reorder round trip is not needed. on_partial is as for
+        call_with_retry.
+
+        Returns (result_dict, None) on success, or (None, error_str) on failure.
+        """
+        return asyncio.run(self.acall_select_and_order(
+            job_posting, model=model, on_progress=on_progress, on_partial=on_partial))
+
+    def select(self, job_posting, model=None, on_progress=None, single_round=True, on_partial=None):
+        """
+        Select and order resume items for job_posting.
+
+        single_round: try call_select_and_order first (one model round trip)
+                      and fall back to call_with_retry + call_reorder if it
+                      fails; False always uses the two-round path.
+        on_partial: as for call_with_retry; only the selection calls stream
+                    partial results.
+
+        A failed reorder round is not fatal: it is reported via on_progress
+        and the selection keeps its round-one order.
+
+        Returns (result_dict, reorder_dict, None) on success, or
+        (None, None, error_str) on failure. reorder_dict is None when no
+        ordering is available; for a single-round result it is the identity
+        order, since the selection is already sorted.
+        """
+        return asyncio.run(self.aselect(
+            job_posting, model=model, on_progress=on_progress, single_round=single_round,
+            on_partial=on_partial))
+
+    def select_many(self, postings, concurrency=DEFAULT_CONCURRENCY, model=None, on_progress=None,
+                    single_round=True):
+        """
+        Select items for a batch of postings on one event loop.
 
-            except (json.JSONDecodeError, KeyError) as e:
-                last_error = f"Attempt {attempt}: Could not parse AI response \u2014 {e}"
-            except Exception as e:
-                last_error = f"Attempt {attempt}: Unexpected error \u2014 {e}"
+        Up to concurrency model requests are in flight at once, so the batch
+        takes roughly as long as its slowest postings rather than the sum of
+        all.
+        See aselect_many for the arguments.
 
-        return None, f"AI reorder failed after 3 attempts.\n\nLast error: {last_error}"
+        Returns a list of (result_dict, reorder_dict, error_str) triples in
+        the order of postings.
+        """
+        return asyncio.run(self.aselect_many(
+            postings, concurrency=concurrency, model=model, on_progress=on_progress,
+            single_round=single_round))
 
     def build_selected_sections(self, result, reorder=None):
         """
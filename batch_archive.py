@@ -0,0 +1,229 @@
+# batch_archive.py
+"""
+Stream a batch of rendered resumes into a single zip or tar archive.
+
+Instead of writing thousands of loose .docx files and zipping them afterwards,
+write_archive() adds each resume to the archive as soon as its render
+finishes, together with one manifest.jsonl line per resume (input hash,
+selected items, render time, size or error). Only max_in_flight rendered
+documents exist at any time, so memory stays bounded regardless of the
+batch size. The manifest is spooled in memory up to MANIFEST_SPOOL_BYTES
+and then spills to a temporary file, so temporary disk use grows linearly
+with the batch: a few hundred bytes per resume, as items are recorded by
+hash rather than by text.
+
+Usage:
+    jobs = ((sections, f"resumes/{name}.docx") for name, sections in selections)
+    summary = Generator.generate_archive(jobs, "batch.zip", workers=4, lean=True)
+"""
+
+import io
+import json
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from generator import _init_worker, _render_timed_job
+from render_cache import stable_hash
+
+ARCHIVE_FORMATS = ("zip", "tar", "tar.gz")
+MANIFEST_NAME = "manifest.jsonl"
+# Manifest bytes kept in memory before spooling to a temporary file.
+MANIFEST_SPOOL_BYTES = 1024 * 1024
+# Sections whose items are chosen per resume; the manifest lists the chosen ones.
+SELECTION_SECTIONS = ("Objective", "Technical Projects", "Core Competencies")
+# Hex digits of stable_hash kept per item in the manifest.
+ITEM_HASH_CHARS = 12
+
+
+def archive_format_for(path):
+    """Infer the archive format from a file name; None if unrecognized."""
+    name = os.fspath(path).lower()
+    if name.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if name.endswith(".tar"):
+        return "tar"
+    if name.endswith(".zip"):
+        return "zip"
+    return None
+
+
+class _ZipSink:
+    def __init__(self, archive_file, compress):
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self._zf = zipfile.ZipFile(archive_file, "w", compression=compression)
+
+    def _info(self, name):
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.compress_type = self._zf.compression
+        return info
+
+    def add(self, name, data):
+        self._zf.writestr(self._info(name), data)
+
+    def add_stream(self, name, stream, size):
+        with self._zf.open(self._info(name), "w") as out:
+            for chunk in iter(lambda: stream.read(64 * 1024), b""):
+                out.write(chunk)
+
+    def close(self):
+        self._zf.close()
+
+
+class _TarSink:
+    def __init__(self, archive_file, compress):
+        mode = "w:gz" if compress else "w"
+        if hasattr(archive_file, "write"):
+            self._tf = tarfile.open(fileobj=archive_file, mode=mode)
+        else:
+            self._tf = tarfile.open(archive_file, mode=mode)
+
+    def add(self, name, data):
+        self.add_stream(name, io.BytesIO(data), len(data))
+
+    def add_stream(self, name, stream, size):
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        self._tf.addfile(info, stream)
+
+    def close(self):
+        self._tf.close()
+
+
+def item_hash(item):
+    """Short content hash identifying a resume item in the manifest."""
+    return stable_hash(item)[:ITEM_HASH_CHARS]
+
+
+def _selection_summary(selected_sections):
+    """
+    item_hash of each chosen item of the SELECTION_SECTIONS sections, in
+    resume order, e.g. {"Objective": ["3f2a..."], "Technical Projects": [...]}.
+    """
+    summary = {}
+    for section in selected_sections:
+        if section["title"] in SELECTION_SECTIONS:
+            content = section["content"]
+            items = [content] if isinstance(content, (str, dict)) else content
+            summary[section["title"]] = [item_hash(item) for item in items]
+    return summary
+
+
+def write_archive(jobs, archive_file, archive_format=None, workers=None, max_in_flight=None,
+                  cache=None, **options):
+    """
+    Render jobs into one archive as they finish.
+
+    jobs: iterable of (selected_sections, member_name) pairs or
+          (selected_sections, member_name, selection) triples. It is consumed
+          lazily, so a generator over a huge batch never materializes.
+          selection is any JSON-serializable record of the choice, typically
+          the AISelector result dict with its master resume indices; it is
+          written to the manifest as given. Without it the manifest lists
+          the item_hash of each chosen SELECTION_SECTIONS item; hash the
+          master resume items the same way to map them back.
+    archive_file: path or writable binary file-like object.
+    archive_format: "zip", "tar" or "tar.gz"; inferred from archive_file's
+                    name when omitted.
+    workers: worker processes (defaults to os.cpu_count()); workers=1
+             renders in the current process.
+    max_in_flight: rendered-but-unwritten plus queued jobs at any time
+                   (default 2 * workers); bounds memory use.
+    cache: optional RenderCache shared by the workers.
+    options: Generator keyword arguments for every job (backend, lean,
+             compression, fit_pages).
+
+    Members are written in completion order. .docx files are deflated
+    already, so zip members are stored and tar is not gzipped unless the
+    resumes were rendered with compression="stored"; an explicit "tar.gz"
+    is always gzipped. manifest.jsonl is written last; each line is
+    {"name", "input_hash", "selection", "render_ms", "bytes"} or, for a
+    failed render, {"name", "input_hash", "selection", "render_ms", "error"}.
+
+    Returns {"written", "failed", "seconds"}.
+    """
+    if archive_format is None:
+        if hasattr(archive_file, "write"):
+            raise ValueError("archive_format is required when writing to a stream")
+        archive_format = archive_format_for(archive_file)
+        if archive_format is None:
+            raise ValueError(f"Cannot infer the archive format of {archive_file!r}; "
+                             f"expected one of: {', '.join(ARCHIVE_FORMATS)}")
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unknown archive format {archive_format!r}; "
+                         f"expected one of: {', '.join(ARCHIVE_FORMATS)}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, workers)
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    max_in_flight = max(1, max_in_flight)
+
+    compress = options.get("compression") == "stored"
+    if archive_format == "zip":
+        sink = _ZipSink(archive_file, compress)
+    else:
+        sink = _TarSink(archive_file, compress or archive_format == "tar.gz")
+
+    start = time.perf_counter()
+    written = failed = 0
+    manifest = tempfile.SpooledTemporaryFile(max_size=MANIFEST_SPOOL_BYTES)
+
+    def record(name, selected_sections, selection, result):
+        nonlocal written, failed
+        data, error, render_ms = result
+        entry = {
+            "name": name,
+            "input_hash": stable_hash(selected_sections),
+            "selection": _selection_summary(selected_sections) if selection is None else selection,
+            "render_ms": round(render_ms, 3),
+        }
+        if error is None:
+            sink.add(name, data)
+            entry["bytes"] = len(data)
+            written += 1
+        else:
+            entry["error"] = error
+            failed += 1
+        manifest.write(json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    try:
+        if workers == 1:
+            for selected_sections, name, *selection in jobs:
+                record(name, selected_sections, selection[0] if selection else None,
+                       _render_timed_job(selected_sections, options, cache))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(cache, options.get("lean", False))) as pool:
+                pending = {}
+                job_iter = iter(jobs)
+                exhausted = False
+                while pending or not exhausted:
+                    # Top up to max_in_flight, then write whatever finished.
+                    while not exhausted and len(pending) < max_in_flight:
+                        job = next(job_iter, None)
+                        if job is None:
+                            exhausted = True
+                            break
+                        selected_sections, name, *selection = job
+                        future = pool.submit(_render_timed_job, selected_sections, options)
+                        pending[future] = (name, selected_sections, selection[0] if selection else None)
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name, selected_sections, selection = pending.pop(future)
+                        record(name, selected_sections, selection, future.result())
+
+        size = manifest.tell()
+        manifest.seek(0)
+        sink.add_stream(MANIFEST_NAME, manifest, size)
+    finally:
+        manifest.close()
+        sink.close()
+
+    return {"written": written, "failed": failed, "seconds": time.perf_counter() - start}
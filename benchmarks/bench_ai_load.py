@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+bench_ai_load.py
+
+Load test of the AI selection pipeline against ai_backends.MockBackend, so it
+runs without a model or network. Sends --requests call_with_retry and
+call_reorder calls with up to --concurrency in flight on one event loop and
+reports throughput, retries, local repairs, failures and p50/p95/p99 latency
+per call type.
+
+The mock draws each reply's latency from a log-normal distribution and fails
+or malforms replies at the given rates, so retries and repairs show up as
+they would against a flaky provider.
+
+Usage:
+    python benchmarks/bench_ai_load.py [--requests N] [--concurrency C]
+        [--latency-median S] [--latency-sigma X] [--error-rate P]
+        [--malformed-rate P] [--call autoselect|reorder|both] [--seed N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from ai_backends import MockBackend, lognormal
+from ai_selector import AISelector, percentile
+
+CALLS = ("autoselect", "reorder")
+
+
+def load_master():
+    for name in ("data.json", "default_data.json"):
+        path = os.path.join(ROOT_DIR, name)
+        if os.path.isfile(path):
+            with open(path, "r") as f:
+                return json.load(f)
+    sys.exit("Error: could not find data.json or default_data.json.")
+
+
+async def run_load(selector, call, requests, concurrency, rng):
+    """Run requests calls of one kind; return (per-call latencies in ms, failures, seconds)."""
+    projects = selector._get_section_content("Technical Projects")
+    competencies = selector._get_section_content("Core Competencies")
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(i):
+        nonlocal failures
+        # Distinct postings, so no prefix or response is shared between calls.
+        posting = f"Posting {i}: security analyst with SIEM, Python and incident response experience."
+        async with semaphore:
+            start = time.perf_counter()
+            if call == "autoselect":
+                _, error = await selector.acall_with_retry(posting)
+            else:
+                _, error = await selector.acall_reorder(
+                    posting, rng.sample(projects, min(len(projects), 3)),
+                    rng.sample(competencies, min(len(competencies), 10)))
+            latencies.append((time.perf_counter() - start) * 1000)
+            failures += error is not None
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return sorted(latencies), failures, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test AISelector against the mock backend.")
+    parser.add_argument("--requests", type=int, default=500, help="Calls per call type")
+    parser.add_argument("--concurrency", type=int, default=50, help="Calls in flight at once")
+    parser.add_argument("--latency-median", type=float, default=0.05, help="Median mock latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.6, help="Log-normal shape of the mock latency")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Probability a mock request fails")
+    parser.add_argument("--malformed-rate", type=float, default=0.10,
+                        help="Probability a mock reply is malformed")
+    parser.add_argument("--call", choices=CALLS + ("both",), default="both", help="Calls to load-test")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the mock and the workload")
+    args = parser.parse_args()
+
+    master_resume = load_master()
+    calls = CALLS if args.call == "both" else (args.call,)
+
+    print(f"{args.requests} calls per type, concurrency {args.concurrency}, "
+          f"latency median {args.latency_median * 1000:.0f} ms (sigma {args.latency_sigma}), "
+          f"error rate {args.error_rate:.0%}, malformed rate {args.malformed_rate:.0%}")
+    print(f"{'call':<12}{'calls/s':>9}{'sent':>7}{'retries':>9}{'repaired':>10}{'failed':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for call in calls:
+        backend = MockBackend(latency=lognormal(args.latency_median, args.latency_sigma),
+                              error_rate=args.error_rate, malformed_rate=args.malformed_rate,
+                              seed=args.seed)
+        selector = AISelector(master_resume, backend=backend)
+        latencies, failures, seconds = asyncio.run(
+            run_load(selector, call, args.requests, args.concurrency, random.Random(args.seed)))
+        stats = selector.prompt_stats()
+        retries = stats["prompts"] - args.requests
+        print(f"{call:<12}{args.requests / seconds:>9.1f}{stats['prompts']:>7}{retries:>9}"
+              f"{stats['repaired']:>10}{failures:>8}"
+              f"{percentile(latencies, 50):>9.1f}{percentile(latencies, 95):>9.1f}"
+              f"{percentile(latencies, 99):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
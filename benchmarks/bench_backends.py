@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+bench_backends.py
+
+Compare render time and output size of the Generator variants (python-docx
+vs direct OOXML backend, default vs lean base package) on data.json and the
+role-specific profiles.
+
+Usage:
+    python benchmarks/bench_backends.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from bench_generator import VARIANTS, profile_cases
+from generator import Generator
+
+
+def time_variant(sections, options, repeat, output_file):
+    """Return (mean milliseconds per render, output size in bytes) for one variant."""
+    Generator(sections, **options).generate(output_file)  # warm the base caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        Generator(sections, **options).generate(output_file)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    return elapsed, os.path.getsize(output_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Generator render variants.")
+    parser.add_argument("--repeat", type=int, default=50, help="Renders per variant and profile")
+    args = parser.parse_args()
+
+    print(f"{'profile':<50}{'variant':<12}{'ms':>9}{'KB':>9}{'speedup':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "bench.docx")
+        for name, sections in profile_cases().items():
+            reference = None
+            for label, options in VARIANTS:
+                elapsed, size = time_variant(sections, options, args.repeat, output_file)
+                reference = reference or elapsed
+                print(f"{name:<50}{label:<12}{elapsed:>9.2f}{size / 1024:>9.1f}{reference / elapsed:>8.1f}x")
+                name = ""
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+bench_compression.py
+
+Measure the save-time versus size trade-off of the package compression modes
+(Generator(compression=...)) on data.json and the role-specific profiles.
+Save time is the "save" stage recorded by RenderTimings, i.e. serializing and
+zipping the package without the section rendering.
+
+Usage:
+    python benchmarks/bench_compression.py [--repeat N] [--backend docx|ooxml] [--lean]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from bench_generator import profile_cases
+from generator import Generator, BACKENDS, COMPRESSION_MODES
+from render_timings import RenderTimings
+
+
+def measure(sections, options, repeat):
+    """Return (median save ms, median total ms, size in bytes) for one mode."""
+    Generator(sections, **options).generate_bytes()  # warm the base caches
+    timings = RenderTimings()
+    for _ in range(repeat):
+        data = Generator(sections, timings=timings, **options).generate_bytes()
+    save_ms = [stage["ms"] for render in timings.renders for stage in render["stages"]
+               if stage["name"] == "save"]
+    total_ms = [render["total_ms"] for render in timings.renders]
+    return statistics.median(save_ms), statistics.median(total_ms), len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark package compression modes.")
+    parser.add_argument("--repeat", type=int, default=20, help="Renders per mode and profile")
+    parser.add_argument("--backend", choices=BACKENDS, default="docx", help="Render backend")
+    parser.add_argument("--lean", action="store_true", help="Use the lean base package")
+    args = parser.parse_args()
+
+    print(f"{'profile':<50}{'mode':<10}{'save ms':>9}{'total ms':>10}{'KB':>9}")
+    for name, sections in profile_cases().items():
+        for mode in COMPRESSION_MODES:
+            options = {"backend": args.backend, "lean": args.lean, "compression": mode}
+            save_ms, total_ms, size = measure(sections, options, args.repeat)
+            print(f"{name:<50}{mode:<10}{save_ms:>9.2f}{total_ms:>10.2f}{size / 1024:>9.1f}")
+            name = ""
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+bench_generator.py
+
+Reproducible benchmark suite for Generator. Renders the shipped data.json,
+every role_specific_data profile and synthetic scaled-up inputs (1k technical
+projects, 10k core competencies, a 500-bullet experience entry) with each
+render variant, and reports time per resume, peak Python memory and output
+size.
+
+Results can be saved as a baseline and later runs compared against it;
+a comparison exits with status 1 if any case got slower, hungrier or bigger
+than the baseline by more than the threshold.
+
+Usage:
+    python benchmarks/bench_generator.py                    # print results
+    python benchmarks/bench_generator.py --save-baseline    # write baseline.json
+    python benchmarks/bench_generator.py --compare          # check for regressions
+    python benchmarks/bench_generator.py --case data.json --variant ooxml
+"""
+
+import argparse
+import copy
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from generator import Generator, LAYOUT_VERSION
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.20
+
+# (label, Generator keyword arguments); the first variant is the reference
+# bench_backends.py compares the others against. Labels key the baseline.
+VARIANTS = [
+    ("docx", {"backend": "docx"}),
+    ("ooxml", {"backend": "ooxml"}),
+    ("docx lean", {"backend": "docx", "lean": True}),
+    ("ooxml lean", {"backend": "ooxml", "lean": True}),
+]
+
+# Metrics compared against the baseline; all are "lower is better".
+METRICS = ("ms_per_resume", "peak_kb", "size_kb")
+
+
+def load_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _replace_section(sections, title, content):
+    sections = copy.deepcopy(sections)
+    for section in sections:
+        if section["title"] == title:
+            section["content"] = content
+    return sections
+
+
+def synthetic_cases(base):
+    """Scaled-up variants of data.json; deterministic so runs are comparable."""
+    projects = next(s["content"] for s in base if s["title"] == "Technical Projects")
+    competencies = next(s["content"] for s in base if s["title"] == "Core Competencies")
+    experience = next(s["content"] for s in base if s["title"] == "Professional Experience")
+
+    many_projects = [f"{projects[i % len(projects)]} (variant {i})" for i in range(1000)]
+    many_competencies = [f"{competencies[i % len(competencies)]} {i}" for i in range(10000)]
+    bullets = experience[0]["details"]
+    long_entry = dict(experience[0], details=[f"{bullets[i % len(bullets)]} ({i})" for i in range(500)])
+
+    return {
+        "synthetic: 1k projects": _replace_section(base, "Technical Projects", many_projects),
+        "synthetic: 10k competencies": _replace_section(base, "Core Competencies", many_competencies),
+        "synthetic: 500-bullet experience": _replace_section(base, "Professional Experience", [long_entry]),
+    }
+
+
+def profile_cases():
+    """{path relative to the repo: sections} for data.json and every role_specific_data profile."""
+    cases = {}
+    for path in [os.path.join(ROOT_DIR, "data.json")] + sorted(
+            glob.glob(os.path.join(ROOT_DIR, "role_specific_data", "*.json"))):
+        cases[os.path.relpath(path, ROOT_DIR)] = load_json(path)
+    return cases
+
+
+def all_cases():
+    cases = profile_cases()
+    cases.update(synthetic_cases(cases["data.json"]))
+    return cases
+
+
+def measure(sections, options, repeat, output_file):
+    """Return {ms_per_resume, peak_kb, size_kb} for one case and variant."""
+    Generator(sections, **options).generate(output_file)  # warm per-process caches
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Generator(sections, **options).generate(output_file)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    # Separate pass for memory: tracemalloc slows rendering down.
+    tracemalloc.start()
+    Generator(sections, **options).generate(output_file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ms_per_resume": statistics.median(samples),
+        "peak_kb": peak / 1024,
+        "size_kb": os.path.getsize(output_file) / 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return a list of regression messages (empty if none)."""
+    regressions = []
+    for key, metrics in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        for metric in METRICS:
+            old, new = reference.get(metric), metrics[metric]
+            if old and new > old * (1 + threshold):
+                regressions.append(f"{key}: {metric} {old:.2f} -> {new:.2f} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Generator and compare against a baseline.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed renders per case and variant (median is reported)")
+    parser.add_argument("--case", action="append", help="Only run cases whose name contains this text (repeatable)")
+    parser.add_argument("--variant", action="append", help="Only run these variants (repeatable)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file path")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative increase before a metric counts as a regression (default 0.20)")
+    args = parser.parse_args()
+
+    cases = all_cases()
+    if args.case:
+        cases = {name: s for name, s in cases.items() if any(c in name for c in args.case)}
+    variants = [(label, opts) for label, opts in VARIANTS if not args.variant or label in args.variant]
+
+    results = {}
+    print(f"{'case':<50}{'variant':<12}{'ms':>10}{'peak KB':>11}{'size KB':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "bench.docx")
+        for name, sections in cases.items():
+            shown = name
+            for label, options in variants:
+                metrics = measure(sections, options, args.repeat, output_file)
+                results[f"{name} [{label}]"] = metrics
+                print(f"{shown:<50}{label:<12}{metrics['ms_per_resume']:>10.2f}"
+                      f"{metrics['peak_kb']:>11.0f}{metrics['size_kb']:>10.1f}")
+                shown = ""
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "layout_version": LAYOUT_VERSION,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.compare:
+        if not os.path.isfile(args.baseline):
+            print(f"\nNo baseline at {args.baseline}; run with --save-baseline first.", file=sys.stderr)
+            sys.exit(2)
+        regressions = compare(results, load_json(args.baseline)["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"\nNo regressions above {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
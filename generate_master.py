@@ -1,15 +1,41 @@
 #!/usr/bin/env python3
 """Generate a master resume containing all data from data.json."""
 
+import argparse
 import json
 import os
 import copy
-from generator import Generator
+from generator import Generator, COMPRESSION_MODES
+from render_cache import RenderCache, DEFAULT_MAX_BYTES
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate a master resume from data.json.")
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the rendered-resume cache (disabled when omitted)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Size limit of the rendered-resume cache in MB",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSION_MODES),
+        default="default",
+        help="Zip compression of the .docx package (stored skips deflate; max is smallest)",
+    )
+    args = parser.parse_args()
+
+    cache = None
+    if args.cache_dir:
+        cache = RenderCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
     data_path = os.path.join(SCRIPT_DIR, "data.json")
     with open(data_path, "r") as f:
         data = json.load(f)
@@ -22,8 +48,10 @@ def main():
             break
 
     output_path = os.path.join(SCRIPT_DIR, "Master_Resume.docx")
-    Generator(sections).generate(output_path)
+    Generator(sections, cache=cache, compression=args.compression).generate(output_path)
     print(f"Master resume generated: {output_path}")
+    if cache:
+        print("Render cache: hit" if cache.hits else "Render cache: miss (stored)")
 
 
 if __name__ == "__main__":
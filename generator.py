@@ -1,19 +1,104 @@
 # generator.py
 from docx import Document
-from docx.shared import Pt, Inches
+from docx.shared import Pt, Inches, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_TAB_ALIGNMENT
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from docx.opc.pkgwriter import _ContentTypesItem
+import copy
+import io
 import os
 import sys
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-import re
+from concurrent.futures import ProcessPoolExecutor
 
-# Refined token checks using regular expressions.
-_email_re = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
-_phone_re = re.compile(r'^\D*(\d\D*){10}$')
-_url_re = re.compile(r'^(https?://|www\.)', re.IGNORECASE)
+from layout import (compile_layout, NAME, CONTACT, HEADER, ENTRY, BODY, BULLET,
+                    INLINE_LIST, SPACER)
+from lean_package import lean_template_bytes
+from render_cache import stable_hash, write_replacing
+from text_formats import RENDERERS
+
+# Render backends: "docx" builds through python-docx's object model,
+# "ooxml" streams WordprocessingML directly (see ooxml_backend.py).
+BACKENDS = ("docx", "ooxml")
+
+# Formats Generator.generate_formats() can write: the .docx plus the
+# text_formats.py renderers.
+OUTPUT_FORMATS = ("docx",) + tuple(RENDERERS)
+
+# Zip compression of the saved package: (zipfile method, deflate level).
+# "default" is what python-docx's doc.save() does; "stored" skips deflate
+# entirely, e.g. when the outputs are re-compressed into an archive anyway.
+COMPRESSION_MODES = {
+    "stored": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, None),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+
+# Bump whenever a change alters the rendered output, so render caches never
+# serve documents produced by an older layout.
+LAYOUT_VERSION = 2
+
+# Named styles defined once in the base document. Paragraphs and runs refer
+# to these by style id instead of repeating direct formatting on every bullet.
+NAME_STYLE = "Resume Name"
+CONTACT_STYLE = "Resume Contact"
+HEADER_STYLE = "Resume Section Header"
+ENTRY_STYLE = "Resume Entry"
+ENTRY_TITLE_STYLE = "Resume Entry Title"  # character style
+BODY_STYLE = "Resume Body"
+BULLET_STYLE = "Resume Bullet"
+SPACER_STYLE = "Resume Spacer"
+HYPERLINK_STYLE = "Resume Hyperlink"  # character style
+
+# Sections whose content AI selection varies per resume. Every other section
+# is identical across a batch, so its rendered fragment is memoized.
+VARYING_SECTIONS = ("Objective", "Technical Projects", "Core Competencies")
+FRAGMENT_CACHE_SIZE = 64
+
+class FragmentCache:
+    """Small thread-safe LRU of rendered section fragments keyed by content hash."""
+
+    def __init__(self, maxsize=FRAGMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+    def put(self, key, fragment):
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+# Rendered python-docx paragraphs per unchanged section (this process only).
+_docx_fragments = FragmentCache()
 
 def set_single_spacing(paragraph):
     """Set single spacing and remove extra space before/after the paragraph."""
@@ -22,8 +107,13 @@ def set_single_spacing(paragraph):
     p_format.space_after = Pt(0)
     p_format.space_before = Pt(0)
 
-def add_hyperlink(paragraph, url, text):
-    """Inserts a hyperlink into a paragraph. Returns the hyperlink element."""
+def add_hyperlink(paragraph, url, text, style_id=None):
+    """
+    Inserts a hyperlink into a paragraph. Returns the hyperlink element.
+
+    With style_id the run refers to that character style; otherwise it is
+    formatted directly (black, underlined).
+    """
     part = paragraph.part
     r_id = part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
     
@@ -35,13 +125,18 @@ def add_hyperlink(paragraph, url, text):
     new_run = OxmlElement('w:r')
     rPr = OxmlElement('w:rPr')
     
-    # Set hyperlink styling (black, underlined) to match Harvard template
-    color = OxmlElement('w:color')
-    color.set(qn('w:val'), "000000")  # Black color
-    rPr.append(color)
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), "single")
-    rPr.append(u)
+    if style_id:
+        r_style = OxmlElement('w:rStyle')
+        r_style.set(qn('w:val'), style_id)
+        rPr.append(r_style)
+    else:
+        # Set hyperlink styling (black, underlined) to match Harvard template
+        color = OxmlElement('w:color')
+        color.set(qn('w:val'), "000000")  # Black color
+        rPr.append(color)
+        u = OxmlElement('w:u')
+        u.set(qn('w:val'), "single")
+        rPr.append(u)
     new_run.append(rPr)
     
     new_run_text = OxmlElement('w:t')
@@ -55,265 +150,513 @@ def add_hyperlink(paragraph, url, text):
     paragraph.add_run("")
     return hyperlink
 
-def is_email(token):
-    """Return True if token is a valid email."""
-    token = token.strip()
-    return bool(_email_re.match(token))
-
-def is_phone(token):
-    """Return True if token consists of (or can be reduced to) exactly 10 digits."""
-    digits = ''.join(ch for ch in token if ch.isdigit())
-    return len(digits) == 10
-
-def is_url(token):
-    """Return True if token is a URL."""
-    token = token.strip()
-    if _url_re.match(token):
-        return True
-    if '.' in token and ' ' not in token:
-        return True
-    return False
+def _add_resume_styles(doc):
+    """Define the named paragraph and character styles the Harvard layout uses."""
+    styles = doc.styles
+    normal = styles['Normal']
 
-class Generator:
-    def __init__(self, selected_sections):
-        self.selected_sections = selected_sections
+    def paragraph_style(name):
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = normal
+        return style
+
+    # Name: 16pt bold, left-aligned, single-spaced (Harvard template)
+    name = paragraph_style(NAME_STYLE)
+    name.font.bold = True
+    name.font.size = Pt(16)
+    name.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+    set_single_spacing(name)
+
+    # Contact line: 11pt, left-aligned, single-spaced
+    contact = paragraph_style(CONTACT_STYLE)
+    contact.font.size = Pt(11)
+    contact.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+    set_single_spacing(contact)
+
+    # Section headers: 12pt bold with space before/after
+    header = paragraph_style(HEADER_STYLE)
+    header.font.bold = True
+    header.font.size = Pt(12)
+    header.paragraph_format.space_before = Pt(12)
+    header.paragraph_format.space_after = Pt(6)
+
+    # Entry lines: title on the left, date at a right-aligned 6.5" tab stop
+    entry = paragraph_style(ENTRY_STYLE)
+    entry.paragraph_format.space_after = Pt(0)
+    entry.paragraph_format.space_before = Pt(6)
+    entry.paragraph_format.tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT)
+
+    entry_title = styles.add_style(ENTRY_TITLE_STYLE, WD_STYLE_TYPE.CHARACTER)
+    entry_title.font.bold = True
+
+    body = paragraph_style(BODY_STYLE)
+    set_single_spacing(body)
+
+    # Bullets and the competency line: indented 0.25", single-spaced
+    bullet = paragraph_style(BULLET_STYLE)
+    bullet.paragraph_format.left_indent = Pt(18)
+    set_single_spacing(bullet)
+
+    # Empty paragraph closing each section
+    spacer = paragraph_style(SPACER_STYLE)
+    spacer.paragraph_format.space_after = Pt(6)
+
+    hyperlink = styles.add_style(HYPERLINK_STYLE, WD_STYLE_TYPE.CHARACTER)
+    hyperlink.font.color.rgb = RGBColor(0, 0, 0)
+    hyperlink.font.underline = True
+
+def _style_id(style_name):
+    """Style id python-docx assigns to a custom style name."""
+    return style_name.replace(" ", "")
+
+def add_styled_paragraph(doc, style_name, text=None):
+    """
+    Append a paragraph that refers to a resume style by id.
+
+    Equivalent to doc.add_paragraph(text, style_name) but skips python-docx's
+    style-name lookup, which searches the whole styles part on every call.
+    """
+    paragraph = doc.add_paragraph(text)
+    paragraph._p.style = _style_id(style_name)
+    return paragraph
+
+def add_styled_run(paragraph, style_name, text):
+    """Append a run that refers to a resume character style by id."""
+    run = paragraph.add_run(text)
+    run._r.style = _style_id(style_name)
+    return run
+
+def add_blocks(doc, blocks):
+    """Render one section's layout blocks (see layout.py) into doc through python-docx."""
+    for block in blocks:
+        kind = block[0]
+        if kind == NAME:
+            # Name: larger, bold, and left-aligned (Harvard template)
+            add_styled_paragraph(doc, NAME_STYLE, block[1])
+        elif kind == CONTACT:
+            # Contact items on one line, separated by bullet points (Harvard template)
+            info_paragraph = add_styled_paragraph(doc, CONTACT_STYLE)
+            for i, (text, url) in enumerate(block[1]):
+                if i > 0:  # Add separator between items (not before first item)
+                    info_paragraph.add_run(" • ")
+                if url:
+                    add_hyperlink(info_paragraph, url, text, _style_id(HYPERLINK_STYLE))
+                else:
+                    info_paragraph.add_run(text)
+        elif kind == HEADER:
+            add_styled_paragraph(doc, HEADER_STYLE, block[1])
+        elif kind == ENTRY:
+            # Two-column entry: title on the left, date at the right tab stop
+            entry_para = add_styled_paragraph(doc, ENTRY_STYLE)
+            add_styled_run(entry_para, ENTRY_TITLE_STYLE, block[1])
+            if block[2] is not None:
+                entry_para.add_run("\t" + block[2])
+        elif kind == BODY:
+            add_styled_paragraph(doc, BODY_STYLE).add_run(block[1])
+        elif kind == BULLET:
+            add_styled_paragraph(doc, BULLET_STYLE, "• " + block[1])
+        elif kind == INLINE_LIST:
+            add_styled_paragraph(doc, BULLET_STYLE, ", ".join(block[1]))
+        elif kind == SPACER:
+            add_styled_paragraph(doc, SPACER_STYLE)
+
+# Styled base documents, built once per process and cloned for every render.
+# Keyed by the lean flag: python-docx's default template or lean_package.py.
+_base_documents = {}
+
+def _styled_base_document(lean=False):
+    """Return the cached base document: Times New Roman 11pt, 0.5" margins, resume styles."""
+    doc = _base_documents.get(lean)
+    if doc is None:
+        doc = Document(io.BytesIO(lean_template_bytes())) if lean else Document()
 
-    def generate(self, output_file):
-        """Generate a Word document resume based on the selected sections."""
-        # Create a new document
-        doc = Document()
-        
         # Set default style to Times New Roman 11pt (Harvard template recommendation)
         style = doc.styles['Normal']
         font = style.font
         font.name = "Times New Roman"
         font.size = Pt(11)
-        
+
         # Set document margins (0.5 inches on all sides)
-        sections = doc.sections
-        for section in sections:
+        for section in doc.sections:
             section.top_margin = Pt(36)    # 0.5 inches = 36 points
             section.bottom_margin = Pt(36)
             section.left_margin = Pt(36)
             section.right_margin = Pt(36)
 
-        # Process each section
-        for section in self.selected_sections:
-            title = section["title"]
-            content = section["content"]
-
-            # Special handling for Personal Information section
-            if title == "Personal Information":
-                # First item is the name - make it larger, bold, and left-aligned (Harvard template)
-                name_paragraph = doc.add_paragraph()
-                name_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT  # Left-align per Harvard template
-                name_run = name_paragraph.add_run(content[0])
-                name_run.bold = True
-                name_run.font.size = Pt(16)  # 16-18pt per Harvard template
-                set_single_spacing(name_paragraph)
-
-                # Remaining items go on one line, separated by bullet points (Harvard template)
-                if len(content) > 1:
-                    info_paragraph = doc.add_paragraph()
-                    info_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT  # Left-align per Harvard template
-                    set_single_spacing(info_paragraph)
-
-                    for i, item in enumerate(content[1:], 1):
-                        if i > 1:  # Add separator between items (not before first item)
-                            separator = info_paragraph.add_run(" • ")  # Bullet point separator per Harvard template
-                            separator.font.size = Pt(11)  # Consistent font size
-
-                        # Check if the item is a special token (email, phone, URL)
-                        if is_email(item):
-                            add_hyperlink(info_paragraph, f"mailto:{item}", item)
-                        elif is_phone(item):
-                            # Format phone number consistently
-                            digits = ''.join(filter(str.isdigit, item))
-                            formatted = f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-                            add_hyperlink(info_paragraph, f"tel:{digits}", formatted)
-                        elif is_url(item):
-                            url = item if item.startswith('http') else f'http://{item}'
-                            add_hyperlink(info_paragraph, url, item)
-                        else:
-                            run = info_paragraph.add_run(item)
-                            run.font.size = Pt(11)  # Consistent font size
-
-                # Add space after personal info with appropriate spacing
-                doc.add_paragraph().paragraph_format.space_after = Pt(6)
-
-            # Special handling for Objective section
-            elif title == "Objective":
-                # Add section header with Harvard template formatting
-                header = doc.add_paragraph()
-                header.paragraph_format.space_before = Pt(12)  # Space before heading
-                header.paragraph_format.space_after = Pt(6)   # Space after heading
-                header_run = header.add_run(title.upper())  # Uppercase for section headers
-                header_run.bold = True
-                header_run.font.size = Pt(12)  # Consistent 12pt for all headers
-                
-                # Add the selected objective
-                obj_para = doc.add_paragraph()
-                obj_para.add_run(content)
-                set_single_spacing(obj_para)
-                # Add space after objective with appropriate spacing
-                doc.add_paragraph().paragraph_format.space_after = Pt(6)
-
-            # Special handling for Education and Professional Experience sections
-            elif title in ["Education", "Professional Experience"]:
-                # Add section header with Harvard template formatting
-                header = doc.add_paragraph()
-                header.paragraph_format.space_before = Pt(12)  # Space before heading
-                header.paragraph_format.space_after = Pt(6)   # Space after heading
-                header_run = header.add_run(title.upper())  # Uppercase for section headers
-                header_run.bold = True
-                header_run.font.size = Pt(12)  # Consistent 12pt for all headers
-
-                # Process each item
-                for item in content:
-                    # Handle Education items (which are lists) differently
-                    if title == "Education" and isinstance(item, list):
-                        # Create a paragraph with tab stops for two-column format
-                        entry_para = doc.add_paragraph()
-                        entry_para.paragraph_format.space_after = Pt(0)
-                        entry_para.paragraph_format.space_before = Pt(6)  # Space before each entry
-                        
-                        # Add a right-aligned tab stop for dates
-                        tab_stops = entry_para.paragraph_format.tab_stops
-                        tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT)
-                        
-                        # Add the institution/degree name (left column)
-                        title_run = entry_para.add_run(item[0])
-                        title_run.bold = True
-                        
-                        # If there's a date in the first detail, extract and place it on the right
-                        date_text = ""
-                        details_to_process = item[1:]
-                        
-                        if len(details_to_process) > 0 and (":" in details_to_process[0] and 
-                                                           ("date" in details_to_process[0].lower() or 
-                                                            "graduated" in details_to_process[0].lower())):
-                            parts = details_to_process[0].split(":", 1)
-                            if len(parts) > 1:
-                                date_text = parts[1].strip()
-                                # Remove this detail from the list since we've extracted the date
-                                details_to_process = details_to_process[1:]
-                        
-                        # Add the date on the right if we found one
-                        if date_text:
-                            entry_para.add_run("\t" + date_text)
-                        
-                        # Remaining items are details as bullet points
-                        for detail in details_to_process:
-                            detail_para = doc.add_paragraph()
-                            detail_para.paragraph_format.left_indent = Pt(18)  # 0.25 inches
-                            detail_para.paragraph_format.space_after = Pt(0)
-                            detail_run = detail_para.add_run("• " + detail)
-                            set_single_spacing(detail_para)
-                    else:
-                        # Professional Experience items are dictionaries
-                        # Create a paragraph with tab stops for two-column format
-                        entry_para = doc.add_paragraph()
-                        entry_para.paragraph_format.space_after = Pt(0)
-                        entry_para.paragraph_format.space_before = Pt(6)  # Space before each entry
-                        
-                        # Add a right-aligned tab stop for dates
-                        tab_stops = entry_para.paragraph_format.tab_stops
-                        tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT)
-                        
-                        # Add the job title/institution (left column)
-                        title_run = entry_para.add_run(item["subtitle"])
-                        title_run.bold = True
-                        
-                        # Add dates if present on the same line (right column)
-                        if "date" in item:
-                            entry_para.add_run("\t" + item["date"])
-                        
-                        # Add details as bullet points
-                        for detail in item["details"]:
-                            detail_para = doc.add_paragraph()
-                            detail_para.paragraph_format.left_indent = Pt(18)  # 0.25 inches
-                            detail_para.paragraph_format.space_after = Pt(0)
-                            detail_run = detail_para.add_run("• " + detail)
-                            set_single_spacing(detail_para)
-
-                # Add space after section with appropriate spacing
-                doc.add_paragraph().paragraph_format.space_after = Pt(6)
-
-            # Special handling for Core Competencies section
-            elif title == "Core Competencies":
-                # Add section header with Harvard template formatting
-                header = doc.add_paragraph()
-                header.paragraph_format.space_before = Pt(12)  # Space before heading
-                header.paragraph_format.space_after = Pt(6)   # Space after heading
-                header_run = header.add_run(title.upper())  # Uppercase for section headers
-                header_run.bold = True
-                header_run.font.size = Pt(12)  # Consistent 12pt for all headers
-
-                # Add content items as a comma-separated list (as per user preference)
-                if content:
-                    comp_para = doc.add_paragraph()
-                    comp_para.paragraph_format.left_indent = Pt(18)  # 0.25 inches
-                    comp_para.paragraph_format.space_after = Pt(0)
-                    comp_para.add_run(", ".join(content))
-                    set_single_spacing(comp_para)
-
-            # Default handling for other sections
+        _add_resume_styles(doc)
+        _base_documents[lean] = doc
+    return doc
+
+def save_document(doc, output_file, compression="default"):
+    """
+    Save doc like doc.save(output_file), deflating the package per compression
+    (a COMPRESSION_MODES key).
+
+    python-docx always writes with ZIP_DEFLATED at zlib's default level, so
+    other modes write the same members through our own ZipFile: content
+    types, package relationships, then every part and its relationships.
+    """
+    if compression == "default":
+        doc.save(output_file)
+        return
+    method, level = COMPRESSION_MODES[compression]
+    package = doc.part.package
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+    with zipfile.ZipFile(output_file, "w", compression=method, compresslevel=level) as zf:
+        zf.writestr(CONTENT_TYPES_URI.membername, _ContentTypesItem.from_parts(parts).blob)
+        zf.writestr(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+        for part in parts:
+            zf.writestr(part.partname.membername, part.blob)
+            if len(part.rels):
+                zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+def new_document(lean=False):
+    """
+    Return a fresh, fully styled document for one render.
+
+    Deep-copying the in-memory base is a pure lxml tree copy, which avoids
+    re-reading python-docx's bundled package and re-parsing its large
+    styles part on every resume.
+    """
+    return copy.deepcopy(_styled_base_document(lean))
+
+# Base packages split into zip members, built once per process for the ooxml backend.
+_base_packages = {}
+
+def base_package_members(lean=False):
+    """
+    Return the styled base document as raw package pieces:
+    (members, document_head, document_tail, document_rels_xml).
+
+    members is the ordered list of (member_name, bytes) python-docx writes;
+    document_head/document_tail are the bytes of word/document.xml before and
+    after the body content, i.e. around the paragraphs a render inserts.
+    """
+    package = _base_packages.get(lean)
+    if package is None:
+        buffer = io.BytesIO()
+        _styled_base_document(lean).save(buffer)
+        with zipfile.ZipFile(buffer) as zf:
+            members = [(name, zf.read(name)) for name in zf.namelist()]
+        document_xml = dict(members)["word/document.xml"]
+        body_start = document_xml.index(b"<w:body>") + len(b"<w:body>")
+        body_end = document_xml.index(b"<w:sectPr", body_start)
+        rels_xml = dict(members)["word/_rels/document.xml.rels"].decode("utf-8")
+        package = (members, document_xml[:body_end], document_xml[body_end:], rels_xml)
+        _base_packages[lean] = package
+    return package
+
+# Render cache used by this pool worker, installed by _init_worker.
+_worker_cache = None
+
+def _init_worker(cache=None, lean=False):
+    """Pool initializer: build the base document before the first job arrives."""
+    global _worker_cache
+    _worker_cache = cache
+    _styled_base_document(lean)
+
+def _generate_job(job, options, cache=None):
+    """Render one (selected_sections, output_file) job inside a pool worker.
+
+    options are Generator keyword arguments. Returns (output_file, None) on
+    success, or (None, error_str) on failure so one bad resume never takes
+    down the rest of the batch. An output_file of None returns the rendered
+    .docx bytes instead of writing a file.
+    """
+    selected_sections, output_file = job
+    try:
+        generator = Generator(selected_sections, cache=cache or _worker_cache, **options)
+        if output_file is None:
+            return generator.generate_bytes(), None
+        generator.generate(output_file)
+        return output_file, None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+def _render_timed_job(selected_sections, options, cache=None):
+    """Render one resume to bytes inside a pool worker for archive batches.
+
+    Returns (docx_bytes, None, render_ms) on success or
+    (None, error_str, render_ms) on failure.
+    """
+    start = time.perf_counter()
+    try:
+        data = Generator(selected_sections, cache=cache or _worker_cache, **options).generate_bytes()
+        return data, None, (time.perf_counter() - start) * 1000
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}", (time.perf_counter() - start) * 1000
+
+class Generator:
+    def __init__(self, selected_sections, backend="docx", cache=None, lean=False, timings=None,
+                 fit_pages=None, compression="default"):
+        """
+        selected_sections: list of {"title", "content"} dicts to render.
+        backend: render backend (see BACKENDS).
+        cache: optional render_cache.RenderCache; identical selections are then
+               rendered once and served from the cache afterwards.
+        lean: build on the minimal template from lean_package.py instead of
+              python-docx's default one, for smaller files and faster saves.
+        timings: optional render_timings.RenderTimings that records wall time
+                 and paragraph/run counts per stage and per section.
+        fit_pages: trim the last Technical Projects and Core Competencies until
+                   the estimated layout fits on this many pages (see
+                   layout_estimate.py); the outcome is kept in fit_report.
+        compression: zip compression of the package, one of COMPRESSION_MODES
+                     ("stored", "fast", "default", "max").
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of: {', '.join(BACKENDS)}")
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(f"Unknown compression {compression!r}; "
+                             f"expected one of: {', '.join(COMPRESSION_MODES)}")
+        self.fit_report = None
+        if fit_pages is not None:
+            from layout_estimate import fit_sections
+            selected_sections, self.fit_report = fit_sections(selected_sections, pages=fit_pages)
+        self.selected_sections = selected_sections
+        self._layout = None
+        self.backend = backend
+        self.cache = cache
+        self.lean = lean
+        self.compression = compression
+        self.timings = timings
+
+    def _stage(self, name, **info):
+        """Timing context for one render stage; a no-op without timings."""
+        if self.timings is None:
+            return nullcontext({})
+        return self.timings.stage(name, **info)
+
+    def _start_timing(self):
+        if self.timings is not None:
+            self.timings.start_render(backend=self.backend, lean=self.lean,
+                                      sections=len(self.selected_sections))
+
+    def _finish_timing(self, cached):
+        if self.timings is not None:
+            self.timings.finish_render(cached=cached)
+
+    def cache_key(self):
+        """Stable content hash of everything that determines the rendered bytes."""
+        return stable_hash({
+            "layout": LAYOUT_VERSION,
+            "lean": self.lean,
+            "compression": self.compression,
+            "sections": self.selected_sections,
+        })
+
+    def layout(self):
+        """The compiled layout blocks for selected_sections (see layout.py), built once."""
+        if self._layout is None:
+            self._layout = compile_layout(self.selected_sections)
+        return self._layout
+
+    @staticmethod
+    def generate_many(jobs, workers=None, chunksize=None, cache=None, **options):
+        """
+        Render many resumes across a process pool.
+
+        jobs: iterable of (selected_sections, output_file) pairs. Pass None as
+              output_file to get the .docx bytes back instead of a file.
+        workers: number of worker processes (defaults to os.cpu_count()).
+                 workers=1 renders in the current process.
+        chunksize: jobs handed to a worker at a time; by default the batch is
+                   split into roughly four chunks per worker to keep pickling
+                   overhead low while still balancing uneven resumes.
+        cache: optional RenderCache shared by every job. Each worker process
+               opens the same cache directory; hit/miss counters are kept per
+               process, so only workers=1 updates the caller's counters.
+        options: Generator keyword arguments applied to every job
+                 (backend, lean, timings, fit_pages, compression). A RenderTimings only collects
+                 records when rendering in-process, i.e. with workers=1.
+
+        Each worker imports this module (and therefore python-docx) once,
+        builds the styled base document in its initializer, and reuses both
+        for every job it receives.
+
+        Returns a list in job order of (output_file or bytes, None) on success
+        or (None, error_str) on failure.
+        """
+        jobs = list(jobs)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(jobs)))
+        if workers == 1:
+            job_fn = partial(_generate_job, options=options, cache=cache)
+            return [job_fn(job) for job in jobs]
+
+        job_fn = partial(_generate_job, options=options)
+        if chunksize is None:
+            chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(cache, options.get("lean", False))) as pool:
+            return list(pool.map(job_fn, jobs, chunksize=chunksize))
+
+    @staticmethod
+    def generate_archive(jobs, archive_file, archive_format=None, workers=None, max_in_flight=None,
+                         cache=None, **options):
+        """
+        Render a batch straight into one zip or tar archive; see
+        batch_archive.write_archive for the arguments and the manifest.
+        """
+        from batch_archive import write_archive
+        return write_archive(jobs, archive_file, archive_format=archive_format, workers=workers,
+                             max_in_flight=max_in_flight, cache=cache, **options)
+
+    def generate_bytes(self):
+        """Render the resume and return the .docx package as bytes."""
+        self._start_timing()
+        data = None
+        if self.cache is not None:
+            key = self.cache_key()
+            with self._stage("cache_lookup"):
+                data = self.cache.get(key)
+            cached = data is not None
+            if data is None:
+                data = self._render_bytes()
+                self.cache.put(key, data)
+        else:
+            cached = False
+            data = self._render_bytes()
+        self._finish_timing(cached)
+        return data
+
+    def _render_bytes(self):
+        buffer = io.BytesIO()
+        self._render(buffer)
+        return buffer.getvalue()
+
+    def generate(self, output_file):
+        """
+        Generate a Word document resume based on the selected sections.
+
+        output_file: a filesystem path (missing directories are created) or a
+                     writable binary file-like object such as an open file,
+                     io.BytesIO, or a member opened with ZipFile.open(name, "w").
+        """
+        self._start_timing()
+        self._ensure_output_dir(output_file)
+        self._finish_timing(self._generate(output_file))
+
+    def generate_formats(self, outputs):
+        """
+        Render several formats of the resume from one compiled layout.
+
+        outputs: {format: output_file} with format in OUTPUT_FORMATS and
+                 output_file a path or a writable binary file-like object.
+                 The .docx is written through generate(), so the backend,
+                 render cache and timings apply to it as usual.
+        """
+        unknown = [fmt for fmt in outputs if fmt not in OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown output format {unknown[0]!r}; expected one of: {', '.join(OUTPUT_FORMATS)}")
+        for fmt, output_file in outputs.items():
+            if fmt == "docx":
+                self.generate(output_file)
+                continue
+            data = RENDERERS[fmt](self.layout()).encode("utf-8")
+            if hasattr(output_file, "write"):
+                output_file.write(data)
+            else:
+                self._ensure_output_dir(output_file)
+                write_replacing(output_file, lambda f: f.write(data))
+
+    def _generate(self, output_file):
+        """
+        Render to output_file through the cache if any; returns True on a
+        cache hit. A path is always replaced, never written in place, since
+        it may be hardlinked to a cache entry (RenderCache(hardlink=True)).
+        """
+        if self.cache is None:
+            if hasattr(output_file, "write"):
+                self._render(output_file)
             else:
-                # Add section header with Harvard template formatting
-                header = doc.add_paragraph()
-                header.paragraph_format.space_before = Pt(12)  # Space before heading
-                header.paragraph_format.space_after = Pt(6)   # Space after heading
-                header_run = header.add_run(title.upper())  # Uppercase for section headers
-                header_run.bold = True
-                header_run.font.size = Pt(12)  # Consistent 12pt for all headers
-
-                # Add content items as bullet points
-                for item in content:
-                    # Check if item is a dictionary with subtitle and date (for projects)
-                    if isinstance(item, dict) and "subtitle" in item:
-                        # Create a paragraph with tab stops for two-column format
-                        entry_para = doc.add_paragraph()
-                        entry_para.paragraph_format.space_after = Pt(0)
-                        entry_para.paragraph_format.space_before = Pt(6)  # Space before each entry
-                        
-                        # Add a right-aligned tab stop for dates
-                        tab_stops = entry_para.paragraph_format.tab_stops
-                        tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT)
-                        
-                        # Add the project name (left column)
-                        title_run = entry_para.add_run(item["subtitle"])
-                        title_run.bold = True
-                        
-                        # Add dates if present on the same line (right column)
-                        if "date" in item:
-                            entry_para.add_run("\t" + item["date"])
-                        
-                        # Add details as bullet points
-                        if "details" in item:
-                            for detail in item["details"]:
-                                detail_para = doc.add_paragraph()
-                                detail_para.paragraph_format.left_indent = Pt(18)  # 0.25 inches
-                                detail_para.paragraph_format.space_after = Pt(0)
-                                detail_run = detail_para.add_run("• " + detail)
-                                set_single_spacing(detail_para)
-                    else:
-                        # Simple string items
-                        item_para = doc.add_paragraph()
-                        item_para.paragraph_format.left_indent = Pt(18)  # 0.25 inches
-                        item_para.paragraph_format.space_after = Pt(0)
-                        item_para.add_run("• " + item)
-                        set_single_spacing(item_para)
-
-                # Add space after section with appropriate spacing
-                doc.add_paragraph().paragraph_format.space_after = Pt(6)
-
-        # Ensure output directory exists
+                write_replacing(output_file, self._render)
+            return False
+
+        key = self.cache_key()
+        with self._stage("cache_lookup"):
+            hit = self.cache.copy_to(key, output_file)
+        if hit:
+            return True
+        data = self._render_bytes()
+        self.cache.put(key, data)
+        if hasattr(output_file, "write"):
+            output_file.write(data)
+        else:
+            write_replacing(output_file, lambda f: f.write(data))
+        return False
+
+    def _render(self, output_file):
+        """Render with the selected backend, bypassing the cache."""
+        if self.backend == "ooxml":
+            from ooxml_backend import write_package
+            write_package(self.layout(), output_file, lean=self.lean, timings=self.timings,
+                          compression=self.compression)
+            return
+
+        # Clone the cached, already-styled base document
+        with self._stage("base_document"):
+            doc = new_document(self.lean)
+        body = doc.element.body
+
+        # Process each section
+        for title, blocks in self.layout():
+            with self._stage("section", title=title) as stage:
+                start = len(body) - 1  # the trailing sectPr stays last
+                if title in VARYING_SECTIONS:
+                    add_blocks(doc, blocks)
+                else:
+                    self._add_memoized_blocks(doc, blocks)
+                if self.timings is not None:
+                    added = body[start:len(body) - 1]
+                    stage["paragraphs"] = len(added)
+                    stage["runs"] = sum(1 for element in added for _ in element.iter(qn("w:r")))
+
+        # Save the document
+        with self._stage("save"):
+            save_document(doc, output_file, self.compression)
+
+    @staticmethod
+    def _add_memoized_blocks(doc, blocks):
+        """
+        Add a section's blocks, reusing the paragraphs rendered for identical
+        blocks in an earlier render. Hyperlinks are re-related in this
+        document so relationship ids match a fresh render.
+        """
+        key = stable_hash(blocks)
+        body = doc.element.body
+        fragment = _docx_fragments.get(key)
+        if fragment is None:
+            start = len(body) - 1  # the trailing sectPr stays last
+            add_blocks(doc, blocks)
+            elements = list(body)[start:-1]
+            rels = doc.part.rels
+            urls = {}
+            for element in elements:
+                for hyperlink in element.iter(qn("w:hyperlink")):
+                    r_id = hyperlink.get(qn("r:id"))
+                    urls[r_id] = rels[r_id].target_ref
+            _docx_fragments.put(key, ([copy.deepcopy(e) for e in elements], urls))
+            return
+
+        elements, urls = fragment
+        for element in elements:
+            element = copy.deepcopy(element)
+            for hyperlink in element.iter(qn("w:hyperlink")):
+                url = urls[hyperlink.get(qn("r:id"))]
+                hyperlink.set(qn("r:id"), doc.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True))
+            body.sectPr.addprevious(element)
+
+    @staticmethod
+    def _ensure_output_dir(output_file):
+        if hasattr(output_file, "write"):
+            return  # caller-supplied stream
         output_dir = os.path.dirname(output_file)
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
-        
-        # Save the document
-        doc.save(output_file)
 # Example usage (uncomment the lines below to test the function):
 # if __name__ == "__main__":
 #     import json
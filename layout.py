@@ -0,0 +1,143 @@
+# layout.py
+"""
+Format-neutral layout representation of a resume.
+
+compile_section() applies the Harvard layout rules once: header casing,
+contact token detection and phone formatting, pulling the Education date out
+of a "Graduated:"/"Date:" detail, and the joined competency line. The result
+is a tuple of blocks that every output backend maps directly onto its own
+format (generator.py and ooxml_backend.py for .docx, text_formats.py for
+plain text, Markdown and HTML), so producing several formats per resume
+processes the input only once.
+
+Blocks are plain tuples, cheap to hash, pickle and compare:
+    (NAME, text)
+    (CONTACT, ((text, url_or_None), ...))
+    (HEADER, text)                  already upper-cased
+    (ENTRY, title, date_or_None)    date goes at the right-aligned tab stop
+    (BODY, text)
+    (BULLET, text)                  rendered with a "• " marker
+    (INLINE_LIST, (item, ...))      rendered as one comma-separated line
+    (SPACER,)                       empty paragraph closing a section
+
+This module has no python-docx dependency.
+"""
+
+import re
+
+NAME = "name"
+CONTACT = "contact"
+HEADER = "header"
+ENTRY = "entry"
+BODY = "body"
+BULLET = "bullet"
+INLINE_LIST = "inline_list"
+SPACER = "spacer"
+
+_SPACER_BLOCK = (SPACER,)
+
+# Refined token checks using regular expressions.
+_email_re = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+_phone_re = re.compile(r'^\D*(\d\D*){10}$')
+_url_re = re.compile(r'^(https?://|www\.)', re.IGNORECASE)
+
+def is_email(token):
+    """Return True if token is a valid email."""
+    token = token.strip()
+    return bool(_email_re.match(token))
+
+def is_phone(token):
+    """Return True if token consists of (or can be reduced to) exactly 10 digits."""
+    digits = ''.join(ch for ch in token if ch.isdigit())
+    return len(digits) == 10
+
+def is_url(token):
+    """Return True if token is a URL."""
+    token = token.strip()
+    if _url_re.match(token):
+        return True
+    if '.' in token and ' ' not in token:
+        return True
+    return False
+
+def contact_item(item):
+    """Return (display_text, link_url or None) for one contact line item."""
+    if is_email(item):
+        return item, f"mailto:{item}"
+    if is_phone(item):
+        # Format phone number consistently
+        digits = ''.join(filter(str.isdigit, item))
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}", f"tel:{digits}"
+    if is_url(item):
+        return item, item if item.startswith('http') else f'http://{item}'
+    return item, None
+
+def _education_entry(item):
+    """Entry block plus remaining details of one Education item (a list)."""
+    # If there's a date in the first detail, extract and place it on the right
+    date_text = ""
+    details = item[1:]
+    if len(details) > 0 and (":" in details[0] and
+                             ("date" in details[0].lower() or
+                              "graduated" in details[0].lower())):
+        parts = details[0].split(":", 1)
+        if len(parts) > 1:
+            date_text = parts[1].strip()
+            # Remove this detail from the list since we've extracted the date
+            details = details[1:]
+    return (ENTRY, item[0], date_text or None), details
+
+def compile_section(section):
+    """Compile one {"title", "content"} section into a tuple of layout blocks."""
+    title = section["title"]
+    content = section["content"]
+    blocks = []
+
+    # Name on its own line, remaining contact items on one separated line
+    if title == "Personal Information":
+        blocks.append((NAME, content[0]))
+        if len(content) > 1:
+            blocks.append((CONTACT, tuple(contact_item(item) for item in content[1:])))
+        blocks.append(_SPACER_BLOCK)
+
+    elif title == "Objective":
+        text = content if isinstance(content, str) else "".join(content)
+        blocks.append((HEADER, title.upper()))
+        blocks.append((BODY, text))
+        blocks.append(_SPACER_BLOCK)
+
+    # Education items are lists; Professional Experience items are dictionaries
+    elif title in ["Education", "Professional Experience"]:
+        blocks.append((HEADER, title.upper()))
+        for item in content:
+            if title == "Education" and isinstance(item, list):
+                entry, details = _education_entry(item)
+                blocks.append(entry)
+            else:
+                blocks.append((ENTRY, item["subtitle"], item["date"] if "date" in item else None))
+                details = item["details"]
+            blocks.extend((BULLET, detail) for detail in details)
+        blocks.append(_SPACER_BLOCK)
+
+    # Competencies as a single comma-separated line
+    elif title == "Core Competencies":
+        blocks.append((HEADER, title.upper()))
+        if content:
+            blocks.append((INLINE_LIST, tuple(content)))
+
+    # Any other section: project-style entries or simple bullet items
+    else:
+        blocks.append((HEADER, title.upper()))
+        for item in content:
+            if isinstance(item, dict) and "subtitle" in item:
+                blocks.append((ENTRY, item["subtitle"], item["date"] if "date" in item else None))
+                blocks.extend((BULLET, detail) for detail in item.get("details", ()))
+            else:
+                blocks.append((BULLET, item))
+        blocks.append(_SPACER_BLOCK)
+
+    return tuple(blocks)
+
+def compile_layout(selected_sections):
+    """Compile selected_sections into a list of (title, blocks) pairs."""
+    return [(section["title"], compile_section(section)) for section in selected_sections]
@@ -0,0 +1,331 @@
+# layout_estimate.py
+"""
+Analytic page-usage estimator for the Harvard resume layout.
+
+Estimates how many pages Generator's output occupies without rendering it
+or opening Word or LibreOffice: every paragraph is word-wrapped with Times
+New Roman advance widths (the Adobe Times metrics, which Word's Times New
+Roman matches for Latin text) at the sizes, indents and paragraph spacing
+defined by the resume styles in generator.py, and the lines are flowed onto
+Letter pages with 0.5" margins.
+
+The estimate is deliberately simple (no kerning, hyphenation or widow
+control) and usually lands within a line or two of Word. It is fast enough
+to evaluate hundreds of candidate trims per resume, which fit_sections()
+uses to drop the lowest-priority Technical Projects and Core Competencies
+until a resume fits on the requested number of pages.
+
+Usage:
+    pages = estimate_pages(selected_sections)
+    trimmed, report = fit_sections(selected_sections, pages=1)
+"""
+
+import math
+
+from layout import (compile_section, NAME, CONTACT, HEADER, ENTRY, BODY, BULLET,
+                    INLINE_LIST, SPACER)
+
+# Letter page with 0.5" margins (points).
+PAGE_HEIGHT = 792.0
+PAGE_WIDTH = 612.0
+MARGIN = 36.0
+BODY_HEIGHT = PAGE_HEIGHT - 2 * MARGIN
+BODY_WIDTH = PAGE_WIDTH - 2 * MARGIN
+BULLET_INDENT = 18.0
+TAB_STOP = 468.0  # right-aligned date column at 6.5"
+
+# Times New Roman: ascent + descent + line gap is 1.15 em per single line.
+LINE_HEIGHT_EM = 1.15
+# Document defaults in both templates: 1.15 line spacing, 10pt after.
+DEFAULT_LINE_SPACING = 1.15
+DEFAULT_SPACE_AFTER = 10.0
+
+# Trimming floors for fit_sections().
+MIN_PROJECTS = 2
+MIN_COMPETENCIES = 5
+
+# Advance widths in 1/1000 em for characters 32..126.
+_TIMES_ROMAN = (
+    250, 333, 408, 500, 500, 833, 778, 180, 333, 333, 500, 564, 250, 333, 250, 278,
+    500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 278, 278, 564, 564, 564, 444,
+    921, 722, 667, 667, 722, 611, 556, 722, 722, 333, 389, 722, 611, 889, 722, 722,
+    556, 722, 667, 556, 611, 722, 722, 944, 722, 722, 611, 333, 278, 333, 469, 500,
+    333, 444, 500, 444, 500, 444, 333, 500, 500, 278, 278, 500, 278, 778, 500, 500,
+    500, 500, 333, 389, 278, 500, 500, 722, 500, 500, 444, 480, 200, 480, 541,
+)
+_TIMES_BOLD = (
+    250, 333, 555, 500, 500, 1000, 833, 278, 333, 333, 500, 570, 250, 333, 250, 278,
+    500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 333, 333, 570, 570, 570, 500,
+    930, 722, 667, 722, 722, 667, 611, 778, 778, 389, 500, 778, 667, 944, 722, 778,
+    611, 778, 722, 556, 667, 722, 722, 1000, 722, 722, 667, 333, 278, 333, 581, 500,
+    333, 500, 556, 444, 556, 444, 333, 500, 556, 278, 333, 556, 278, 833, 556, 500,
+    556, 556, 444, 389, 333, 556, 500, 722, 500, 500, 444, 394, 220, 394, 520,
+)
+# Punctuation common in resumes outside ASCII; same width in both weights.
+_EXTRA_WIDTHS = {"•": 350, "–": 500, "—": 1000, "‘": 333, "’": 333, "“": 444, "”": 444, "…": 1000}
+_DEFAULT_WIDTH = 500
+
+
+def _width_table(ascii_widths):
+    table = {chr(32 + i): w for i, w in enumerate(ascii_widths)}
+    table.update(_EXTRA_WIDTHS)
+    return table
+
+_WIDTHS = {False: _width_table(_TIMES_ROMAN), True: _width_table(_TIMES_BOLD)}
+_word_widths = {False: {}, True: {}}  # word -> width in 1/1000 em, per weight
+
+
+def text_width(text, size=11, bold=False):
+    """Width of text in points, set in Times New Roman at size."""
+    widths = _WIDTHS[bold]
+    return sum(widths.get(ch, _DEFAULT_WIDTH) for ch in text) * size / 1000
+
+
+def _word_width(word, bold):
+    cache = _word_widths[bold]
+    width = cache.get(word)
+    if width is None:
+        widths = _WIDTHS[bold]
+        width = cache[word] = sum(widths.get(ch, _DEFAULT_WIDTH) for ch in word)
+    return width
+
+
+def wrap_words(words, width, size=11, bold=False):
+    """
+    Greedy word wrap, as Word does without hyphenation. Returns the index of
+    the line each word ends on (0-based), so callers can count the lines of
+    any prefix of the words.
+    """
+    limit = width * 1000 / size
+    space = _WIDTHS[bold][" "]
+    line = 0
+    used = None
+    line_of = []
+    for word in words:
+        w = _word_width(word, bold)
+        if used is None:
+            used = w
+        elif used + space + w <= limit:
+            used += space + w
+        else:
+            line += 1
+            used = w
+        if used > limit:
+            # A word wider than the line is broken across lines.
+            extra = math.ceil(used / limit) - 1
+            line += extra
+            used -= extra * limit
+        line_of.append(line)
+    return line_of
+
+
+def count_lines(text, width, size=11, bold=False):
+    """Number of lines text wraps to in a column width points wide (min 1)."""
+    words = text.split()
+    if not words:
+        return 1
+    return wrap_words(words, width, size, bold)[-1] + 1
+
+
+class Paragraph:
+    """Vertical metrics of one rendered paragraph."""
+    __slots__ = ("lines", "line_height", "before", "after")
+
+    def __init__(self, lines, size=11, spacing=DEFAULT_LINE_SPACING, before=0.0, after=DEFAULT_SPACE_AFTER):
+        self.lines = lines
+        self.line_height = size * LINE_HEIGHT_EM * spacing
+        self.before = before
+        self.after = after
+
+
+# Paragraph factories, one per resume style in generator.py.
+def _header(title):
+    return Paragraph(count_lines(title, BODY_WIDTH, 12, True), size=12, before=12, after=6)
+
+def _bullet(text):
+    return Paragraph(count_lines(text, BODY_WIDTH - BULLET_INDENT), spacing=1, after=0)
+
+def _entry(title, date=None):
+    # The date sits at the right tab stop when it fits beside the title;
+    # otherwise Word moves it (and any overflow) onto further lines.
+    lines = count_lines(title, BODY_WIDTH, bold=True)
+    if date and text_width(title, bold=True) + text_width(" " + date) > TAB_STOP:
+        lines += count_lines(date, BODY_WIDTH)
+    return Paragraph(lines, before=6, after=0)
+
+def _spacer():
+    return Paragraph(1, after=6)
+
+
+def block_paragraph(block):
+    """Paragraph metrics for one layout block (see layout.py)."""
+    kind = block[0]
+    if kind == NAME:
+        return Paragraph(count_lines(block[1], BODY_WIDTH, 16, True), size=16, spacing=1, after=0)
+    if kind == CONTACT:
+        text = " • ".join(text for text, _ in block[1])
+        return Paragraph(count_lines(text, BODY_WIDTH), spacing=1, after=0)
+    if kind == HEADER:
+        return _header(block[1])
+    if kind == ENTRY:
+        return _entry(block[1], block[2])
+    if kind == BODY:
+        return Paragraph(count_lines(block[1], BODY_WIDTH), spacing=1, after=0)
+    if kind == BULLET:
+        return _bullet("• " + block[1])
+    if kind == INLINE_LIST:
+        return _bullet(", ".join(block[1]))
+    if kind == SPACER:
+        return _spacer()
+    raise ValueError(f"Unknown layout block {kind!r}")
+
+
+def section_paragraphs(section):
+    """Paragraph metrics for one selected section, following Generator's rules."""
+    return [block_paragraph(block) for block in compile_section(section)]
+
+
+def flow_pages(paragraphs):
+    """
+    Lay paragraphs out line by line onto pages. Returns the pages used as a
+    float: 1.4 means the second page is 40% full.
+    """
+    page = 0
+    y = 0.0
+    for p in paragraphs:
+        if y > 0:  # space before is dropped at the top of a page
+            y += p.before
+        for _ in range(p.lines):
+            if y + p.line_height > BODY_HEIGHT and y > 0:
+                page += 1
+                y = 0.0
+            y += p.line_height
+        y = min(y + p.after, BODY_HEIGHT)
+    return page + y / BODY_HEIGHT
+
+
+def estimate_pages(selected_sections):
+    """Estimated pages used by Generator(selected_sections) output, as a float."""
+    paragraphs = []
+    for section in selected_sections:
+        paragraphs.extend(section_paragraphs(section))
+    return flow_pages(paragraphs)
+
+
+def _competency_lines(competencies):
+    """
+    Lines of the joined competency paragraph for every prefix length:
+    result[k] is the line count when only the first k competencies are kept.
+    Greedy wrapping is prefix-stable, so one pass covers every trim (the
+    trailing comma of the last kept item is counted, a ~3pt overestimate).
+    """
+    words = []
+    ends = []
+    for i, item in enumerate(competencies):
+        item_words = item.split() or [""]
+        if i < len(competencies) - 1:
+            item_words[-1] += ","
+        words.extend(item_words)
+        ends.append(len(words) - 1)
+    line_of = wrap_words(words, BODY_WIDTH - BULLET_INDENT)
+    return [0] + [line_of[end] + 1 for end in ends]
+
+
+def fit_sections(selected_sections, pages=1, min_projects=MIN_PROJECTS, min_competencies=MIN_COMPETENCIES):
+    """
+    Trim the lowest-priority Technical Projects and Core Competencies until
+    the estimated layout fits on pages pages.
+
+    Selections are ordered most relevant first, so items are dropped from the
+    end, never below min_projects / min_competencies. Among the trims that
+    fit, the one removing the least text (measured in full-width lines) wins,
+    so a few trailing competencies go before a whole project does. Candidates
+    re-flow cached paragraph metrics only, and layouts are memoized by the
+    competency paragraph's line count.
+
+    Returns (trimmed_sections, report) where report is
+    {"pages", "fits", "removed_projects", "removed_competencies"}. When even
+    the minimum selection overflows, that minimum is returned with fits False.
+    """
+    projects_index = competencies_index = None
+    blocks = []  # paragraph lists per section, in order
+    for i, section in enumerate(selected_sections):
+        if section["title"] == "Technical Projects":
+            projects_index = i
+            blocks.append([section_paragraphs({"title": section["title"], "content": [item]})[1:-1]
+                           for item in section["content"]])
+        elif section["title"] == "Core Competencies":
+            competencies_index = i
+            blocks.append(None)
+        else:
+            blocks.append(section_paragraphs(section))
+
+    projects = selected_sections[projects_index]["content"] if projects_index is not None else []
+    competencies = selected_sections[competencies_index]["content"] if competencies_index is not None else []
+    competency_lines = _competency_lines(competencies)
+
+    # Cost of dropping everything after the first k items, in lines of text.
+    project_cost = [0.0] * (len(projects) + 1)
+    for k in range(len(projects) - 1, -1, -1):
+        project_cost[k] = project_cost[k + 1] + sum(p.lines for p in blocks[projects_index][k])
+    competency_cost = [0.0] * (len(competencies) + 1)
+    line_width = BODY_WIDTH - BULLET_INDENT
+    for k in range(len(competencies) - 1, -1, -1):
+        competency_cost[k] = competency_cost[k + 1] + text_width(competencies[k] + ", ") / line_width
+
+    layouts = {}
+
+    def layout(num_projects, num_competencies):
+        key = (num_projects, competency_lines[num_competencies])
+        used = layouts.get(key)
+        if used is not None:
+            return used
+        paragraphs = []
+        for i, block in enumerate(blocks):
+            if i == projects_index:
+                paragraphs.append(_header("TECHNICAL PROJECTS"))
+                for item in block[:num_projects]:
+                    paragraphs.extend(item)
+                paragraphs.append(_spacer())
+            elif i == competencies_index:
+                paragraphs.append(_header("CORE COMPETENCIES"))
+                if num_competencies:
+                    paragraphs.append(Paragraph(competency_lines[num_competencies], spacing=1, after=0))
+            else:
+                paragraphs.extend(block)
+        used = layouts[key] = flow_pages(paragraphs)
+        return used
+
+    low_projects = min(len(projects), min_projects)
+    low_competencies = min(len(competencies), min_competencies)
+    best = None  # (cost, num_projects, num_competencies, pages used)
+    for num_projects in range(len(projects), low_projects - 1, -1):
+        if best is not None and project_cost[num_projects] >= best[0]:
+            break  # dropping more projects can only cost more
+        # Keep the most competencies that fit with this many projects.
+        for num_competencies in range(len(competencies), low_competencies - 1, -1):
+            used = layout(num_projects, num_competencies)
+            if used <= pages:
+                cost = project_cost[num_projects] + competency_cost[num_competencies]
+                if best is None or cost < best[0]:
+                    best = (cost, num_projects, num_competencies, used)
+                break
+
+    if best is None:
+        num_projects, num_competencies = low_projects, low_competencies
+        used = layout(num_projects, num_competencies)
+    else:
+        _, num_projects, num_competencies, used = best
+
+    trimmed = list(selected_sections)
+    if projects_index is not None:
+        trimmed[projects_index] = dict(trimmed[projects_index], content=projects[:num_projects])
+    if competencies_index is not None:
+        trimmed[competencies_index] = dict(trimmed[competencies_index], content=competencies[:num_competencies])
+    report = {
+        "pages": used,
+        "fits": used <= pages,
+        "removed_projects": projects[num_projects:],
+        "removed_competencies": competencies[num_competencies:],
+    }
+    return trimmed, report
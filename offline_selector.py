@@ -0,0 +1,198 @@
+# offline_selector.py
+"""
+Deterministic, offline drop-in for AISelector.
+
+OfflineSelector scores every master resume item against the job posting
+with TF-IDF cosine similarity and answers call_with_retry, call_reorder,
+call_select_and_order, select and select_many (and their async forms) with
+the same result structures the AI path returns, so it plugs in anywhere an
+AISelector is used. No model is contacted and nothing is cached.
+
+The term matrices are built once per master resume; select_many scores a
+whole batch of postings with one matrix product per chunk.
+
+Requires NumPy (imported on first use). Without it every call returns the
+NUMPY_MISSING error instead of a selection.
+
+Usage:
+    selector = OfflineSelector(master_resume)
+    result, reorder, error = selector.select(job_posting)
+    selected_sections = selector.build_selected_sections(result, reorder)
+"""
+
+import math
+from collections import Counter
+
+from ai_selector import AISelector
+from prerank import item_text, tokenize
+
+# Projects scoring at least this fraction of the best project are selected
+# (2 to 4 of them, as the AI prompt requires).
+PROJECT_THRESHOLD = 0.5
+MIN_PROJECTS = 2
+MAX_PROJECTS = 4
+# Competencies scoring at least this fraction of the best competency are
+# selected; at least MIN_COMPETENCIES are always kept.
+COMPETENCY_THRESHOLD = 0.3
+MIN_COMPETENCIES = 5
+# Postings scored per matrix product in select_many; bounds memory use.
+BATCH_CHUNK = 512
+
+SECTIONS = ("Objective", "Technical Projects", "Core Competencies")
+
+NUMPY_MISSING = "Offline selection needs NumPy. Install it with: pip install numpy"
+
+
+class OfflineSelector(AISelector):
+    def __init__(self, master_resume: list, **options):
+        """
+        master_resume: the full resume data (list of sections).
+        options: AISelector keyword arguments (cache, top_k, hedging),
+                 accepted for compatibility and ignored; offline scoring is
+                 cheaper than a cache lookup and always sees every item.
+        """
+        super().__init__(master_resume)
+        self._model = None
+
+    def _term_model(self):
+        """Build (once) the vocabulary, IDF weights and per-section item matrices."""
+        if self._model is not None:
+            return self._model
+        import numpy as np
+
+        docs = {title: [Counter(tokenize(item_text(item))) for item in self._get_section_content(title)]
+                for title in SECTIONS}
+        all_docs = [doc for title in SECTIONS for doc in docs[title]]
+        vocabulary = {}
+        document_frequency = Counter()
+        for doc in all_docs:
+            document_frequency.update(doc.keys())
+            for term in doc:
+                vocabulary.setdefault(term, len(vocabulary))
+        n = len(all_docs)
+        idf = np.zeros(len(vocabulary))
+        for term, column in vocabulary.items():
+            idf[column] = math.log((1 + n) / (1 + document_frequency[term])) + 1
+
+        matrices = {}
+        for title in SECTIONS:
+            matrix = np.zeros((len(docs[title]), len(vocabulary)))
+            for row, doc in enumerate(docs[title]):
+                for term, tf in doc.items():
+                    matrix[row, vocabulary[term]] = 1 + math.log(tf)
+            matrix *= idf
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrices[title] = matrix / np.where(norms == 0, 1, norms)
+        self._model = (vocabulary, idf, matrices)
+        return self._model
+
+    def _query_matrix(self, postings):
+        """L2-normalized TF-IDF rows for postings over the master vocabulary."""
+        import numpy as np
+
+        vocabulary, idf, _ = self._term_model()
+        queries = np.zeros((len(postings), len(vocabulary)))
+        for row, posting in enumerate(postings):
+            counts = Counter(term for term in tokenize(posting) if term in vocabulary)
+            for term, tf in counts.items():
+                queries[row, vocabulary[term]] = 1 + math.log(tf)
+        queries *= idf
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        return queries / np.where(norms == 0, 1, norms)
+
+    def _score(self, postings):
+        """{section title: (len(postings), len(items)) cosine similarity matrix}."""
+        _, _, matrices = self._term_model()
+        queries = self._query_matrix(postings)
+        return {title: queries @ matrix.T for title, matrix in matrices.items()}
+
+    @staticmethod
+    def _ranked(scores, threshold, minimum, maximum=None):
+        """Indices by descending score (ties: lower index), cut at threshold * best."""
+        import numpy as np
+
+        order = np.argsort(-scores, kind="stable")
+        if len(order) == 0:
+            return []
+        cutoff = threshold * scores[order[0]]
+        count = int(np.count_nonzero(scores >= cutoff)) if scores[order[0]] > 0 else 0
+        count = max(count, minimum)
+        if maximum is not None:
+            count = min(count, maximum)
+        return [int(i) for i in order[:count]]
+
+    def _select_row(self, scores, row):
+        """Selection dict for one posting from the batch score matrices."""
+        objectives = scores["Objective"][row]
+        return {
+            "objective_index": self._ranked(objectives, 1.0, 1, 1)[0] if len(objectives) else 0,
+            "technical_project_indices": self._ranked(
+                scores["Technical Projects"][row], PROJECT_THRESHOLD, MIN_PROJECTS, MAX_PROJECTS),
+            "core_competency_indices": self._ranked(
+                scores["Core Competencies"][row], COMPETENCY_THRESHOLD, MIN_COMPETENCIES),
+        }
+
+    def _select_one(self, job_posting):
+        try:
+            result = self._select_row(self._score([job_posting]), 0)
+        except ImportError:
+            return None, NUMPY_MISSING
+        validation_error = self._validate_select_and_order_response(result)
+        if validation_error:
+            return None, f"Offline selection failed: {validation_error}"
+        return result, None
+
+    async def acall_with_retry(self, job_posting, model=None, on_progress=None, on_partial=None):
+        """Offline selection; the index lists are already in relevance order."""
+        return self._select_one(job_posting)
+
+    async def acall_select_and_order(self, job_posting, model=None, on_progress=None, on_partial=None):
+        """Offline selection; the index lists are already in relevance order."""
+        return self._select_one(job_posting)
+
+    async def acall_reorder(self, job_posting, selected_projects, selected_competencies, model=None,
+                            on_progress=None):
+        """Order already-selected items by similarity to job_posting."""
+        try:
+            import numpy as np
+        except ImportError:
+            return None, NUMPY_MISSING
+
+        query = self._query_matrix([job_posting])[0]
+
+        def order(items):
+            rows = self._query_matrix([item_text(item) for item in items])
+            return [int(i) for i in np.argsort(-(rows @ query), kind="stable")]
+
+        return {
+            "technical_project_order": order(selected_projects),
+            "core_competency_order": order(selected_competencies),
+        }, None
+
+    def select_many(self, postings, concurrency=None, model=None, on_progress=None, single_round=True):
+        """
+        Select items for a batch of postings, scoring BATCH_CHUNK postings
+        per matrix product. concurrency, model and single_round are ignored.
+
+        Returns a list of (result_dict, reorder_dict, error_str) triples in
+        the order of postings, as AISelector.select_many does.
+        """
+        postings = list(postings)
+        try:
+            self._term_model()
+        except ImportError:
+            return [(None, None, NUMPY_MISSING) for _ in postings]
+        results = []
+        for start in range(0, len(postings), BATCH_CHUNK):
+            chunk = postings[start:start + BATCH_CHUNK]
+            scores = self._score(chunk)
+            for row in range(len(chunk)):
+                result = self._select_row(scores, row)
+                validation_error = self._validate_select_and_order_response(result)
+                if validation_error:
+                    results.append((None, None, f"Offline selection failed: {validation_error}"))
+                    continue
+                results.append((result, self._identity_reorder(result), None))
+            if on_progress:
+                on_progress(f"Selected {len(results)} of {len(postings)} postings.")
+        return results
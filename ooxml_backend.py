@@ -0,0 +1,262 @@
+# ooxml_backend.py
+"""
+Direct OOXML render backend for Generator.
+
+Instead of building the document through python-docx's object model, this
+backend turns each section's layout blocks (see layout.py) into
+WordprocessingML and streams it straight into word/document.xml inside the
+output zip. Every other package part is copied
+verbatim from the cached, styled base document in generator.py, so the result
+matches the python-docx path element for element (same paragraphs, runs,
+properties, attribute order and hyperlink relationship ids).
+
+Select it with Generator(selected_sections, backend="ooxml").
+"""
+
+import os
+import re
+import time
+import zipfile
+from contextlib import nullcontext
+from xml.sax.saxutils import escape
+
+from generator import (base_package_members, COMPRESSION_MODES, FragmentCache,
+                       VARYING_SECTIONS, NAME_STYLE, CONTACT_STYLE, HEADER_STYLE, ENTRY_STYLE,
+                       ENTRY_TITLE_STYLE, BODY_STYLE, BULLET_STYLE, SPACER_STYLE, HYPERLINK_STYLE)
+from layout import NAME, CONTACT, HEADER, ENTRY, BODY, BULLET, INLINE_LIST, SPACER
+from render_cache import stable_hash
+
+_HYPERLINK_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+_special_chars_re = re.compile(r'[\t\r\n]')
+# Characters outside the XML 1.0 Char production (C0 controls other than tab,
+# CR and LF, lone surrogates, U+FFFE/U+FFFF); lxml, and so python-docx, rejects them.
+_illegal_xml_chars_re = re.compile('[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+# Paragraph and run properties, written exactly as python-docx serializes the
+# named-style references in generator.py.
+def _pstyle(style_name):
+    return f'<w:pPr><w:pStyle w:val="{style_name.replace(" ", "")}"/></w:pPr>'
+
+def _rstyle(style_name):
+    return f'<w:rPr><w:rStyle w:val="{style_name.replace(" ", "")}"/></w:rPr>'
+
+_NAME_PPR = _pstyle(NAME_STYLE)
+_CONTACT_PPR = _pstyle(CONTACT_STYLE)
+_HEADER_PPR = _pstyle(HEADER_STYLE)
+_ENTRY_PPR = _pstyle(ENTRY_STYLE)
+_BODY_PPR = _pstyle(BODY_STYLE)
+_BULLET_PPR = _pstyle(BULLET_STYLE)
+_SPACER = f'<w:p>{_pstyle(SPACER_STYLE)}</w:p>'
+_ENTRY_TITLE_RPR = _rstyle(ENTRY_TITLE_STYLE)
+_HYPERLINK_RPR = _rstyle(HYPERLINK_STYLE)
+_SEPARATOR = '<w:r><w:t xml:space="preserve"> • </w:t></w:r>'
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+def _escape(text, entities=None):
+    """escape() that raises ValueError, as python-docx does, for characters XML cannot hold."""
+    if _illegal_xml_chars_re.search(text):
+        raise ValueError("All strings must be XML compatible: Unicode or ASCII, "
+                         "no NULL bytes or control characters")
+    return escape(text, entities or {})
+
+def _t(text):
+    """Return a w:t element, preserving edge whitespace like python-docx does."""
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{_escape(text)}</w:t>'
+    return f'<w:t>{_escape(text)}</w:t>'
+
+def _run_content(text):
+    """Translate run text the way python-docx does: tabs become w:tab, CR/LF become w:br."""
+    if not _special_chars_re.search(text):
+        return _t(text) if text else ""
+    parts = []
+    buf = []
+    for char in text:
+        if char == "\t" or char in "\r\n":
+            if buf:
+                parts.append(_t("".join(buf)))
+                buf = []
+            parts.append("<w:tab/>" if char == "\t" else "<w:br/>")
+        else:
+            buf.append(char)
+    if buf:
+        parts.append(_t("".join(buf)))
+    return "".join(parts)
+
+def _run(text, rpr=""):
+    content = _run_content(text)
+    if not rpr and not content:
+        return "<w:r/>"
+    return f'<w:r>{rpr}{content}</w:r>'
+
+def _paragraph(ppr, text):
+    """Mirror doc.add_paragraph(text, style): no run at all for empty text."""
+    return f'<w:p>{ppr}{_run(text) if text else ""}</w:p>'
+
+def _entry(title, date=None):
+    date_run = _run("\t" + date) if date is not None else ""
+    return f'<w:p>{_ENTRY_PPR}{_run(title, _ENTRY_TITLE_RPR)}{date_run}</w:p>'
+
+def _bullet(text):
+    return _paragraph(_BULLET_PPR, text)
+
+
+class _Relationships:
+    """Hyperlink relationships for word/document.xml, numbered like python-docx."""
+
+    def __init__(self, existing_ids):
+        self._ids = set(existing_ids)
+        self._by_url = {}
+        self.added = []
+
+    def relate_to(self, url):
+        r_id = self._by_url.get(url)
+        if r_id is None:
+            n = 1
+            while f"rId{n}" in self._ids:
+                n += 1
+            r_id = f"rId{n}"
+            self._ids.add(r_id)
+            self._by_url[url] = r_id
+            self.added.append((r_id, url))
+        return r_id
+
+    def xml(self, base_rels_xml):
+        """Return base_rels_xml with the added hyperlink relationships appended."""
+        extra = "".join(
+            f'<Relationship Id="{r_id}" Type="{_HYPERLINK_RELTYPE}" Target="{_escape(url, _ATTR_ENTITIES)}" TargetMode="External"/>'
+            for r_id, url in self.added
+        )
+        head, tail = base_rels_xml.rsplit("</Relationships>", 1)
+        return f"{head}{extra}</Relationships>{tail}"
+
+
+class _RecordingRelationships:
+    """Stands in for _Relationships while rendering a memoized fragment.
+
+    Each hyperlink id is written as a NUL-delimited placeholder (_escape rejects
+    NUL in document text, so it cannot be mistaken for one) so the fragment
+    can be spliced into any document and related there.
+    """
+
+    def __init__(self):
+        self.urls = []
+
+    def relate_to(self, url):
+        if url not in self.urls:
+            self.urls.append(url)
+        return f"\x00{self.urls.index(url)}\x00"
+
+
+# Rendered document.xml fragments per unchanged section (this process only).
+_fragments = FragmentCache()
+
+def _hyperlink(rels, url, text):
+    r_id = rels.relate_to(url)
+    return (f'<w:hyperlink r:id="{r_id}"><w:r>{_HYPERLINK_RPR}<w:t>{_escape(text)}</w:t></w:r>'
+            f'</w:hyperlink><w:r/>')
+
+def render_blocks(blocks, rels):
+    """Return the WordprocessingML paragraphs for one section's layout blocks."""
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == NAME:
+            out.append(_paragraph(_NAME_PPR, block[1]))
+        elif kind == CONTACT:
+            runs = []
+            for i, (text, url) in enumerate(block[1]):
+                if i > 0:
+                    runs.append(_SEPARATOR)
+                runs.append(_hyperlink(rels, url, text) if url else _run(text))
+            out.append(f'<w:p>{_CONTACT_PPR}{"".join(runs)}</w:p>')
+        elif kind == HEADER:
+            out.append(_paragraph(_HEADER_PPR, block[1]))
+        elif kind == ENTRY:
+            out.append(_entry(block[1], block[2]))
+        elif kind == BODY:
+            out.append(f'<w:p>{_BODY_PPR}{_run(block[1])}</w:p>')
+        elif kind == BULLET:
+            out.append(_bullet("• " + block[1]))
+        elif kind == INLINE_LIST:
+            out.append(_bullet(", ".join(block[1])))
+        elif kind == SPACER:
+            out.append(_SPACER)
+    return "".join(out)
+
+def render_memoized_section(title, blocks, rels):
+    """
+    render_blocks() for sections outside VARYING_SECTIONS, reusing the XML
+    rendered for identical blocks earlier in this process.
+    """
+    if title in VARYING_SECTIONS:
+        return render_blocks(blocks, rels)
+
+    key = stable_hash(blocks)
+    fragment = _fragments.get(key)
+    if fragment is None:
+        recorder = _RecordingRelationships()
+        fragment = (render_blocks(blocks, recorder).split("\x00"), recorder.urls)
+        _fragments.put(key, fragment)
+
+    pieces, urls = fragment
+    if len(pieces) == 1:
+        return pieces[0]
+    # Odd positions hold indexes into urls; relate them in this document.
+    return "".join(
+        piece if i % 2 == 0 else rels.relate_to(urls[int(piece)])
+        for i, piece in enumerate(pieces)
+    )
+
+def write_package(layout, output_file, lean=False, timings=None, compression="default"):
+    """
+    Write a complete .docx for a compiled layout (layout.compile_layout) to
+    output_file (a path or a binary file-like object), streaming document.xml
+    one section at a time.
+    lean selects the minimal base package (see lean_package.py); timings is an
+    optional render_timings.RenderTimings; compression is a COMPRESSION_MODES
+    key.
+    """
+    stage = timings.stage if timings is not None else (lambda name, **info: nullcontext({}))
+
+    with stage("base_document"):
+        members, doc_head, doc_tail, base_rels = base_package_members(lean)
+        rel_ids = re.findall(r'Id="([^"]+)"', base_rels)
+        rels = _Relationships(rel_ids)
+
+    package_start = time.perf_counter()
+    section_ms = 0.0
+    method, level = COMPRESSION_MODES[compression]
+    try:
+        with zipfile.ZipFile(output_file, "w", compression=method, compresslevel=level) as zf:
+            for name, blob in members:
+                if name == "word/document.xml":
+                    with zf.open(name, "w") as stream:
+                        stream.write(doc_head)
+                        for title, blocks in layout:
+                            # Section stages include deflating their XML into the zip.
+                            with stage("section", title=title) as entry:
+                                xml = render_memoized_section(title, blocks, rels)
+                                stream.write(xml.encode("utf-8"))
+                                if timings is not None:
+                                    entry["paragraphs"] = xml.count("<w:p>")
+                                    entry["runs"] = xml.count("<w:r>") + xml.count("<w:r/>")
+                            section_ms += entry.get("ms", 0.0)
+                        stream.write(doc_tail)
+                elif name == "word/_rels/document.xml.rels":
+                    zf.writestr(name, rels.xml(base_rels).encode("utf-8"))
+                else:
+                    zf.writestr(name, blob)
+    except BaseException:
+        # Like python-docx, leave no half-written package behind (e.g. after
+        # _escape rejected a character).
+        if not hasattr(output_file, "write"):
+            try:
+                os.remove(output_file)
+            except FileNotFoundError:
+                pass
+        raise
+    if timings is not None:
+        # Everything in the package write except the section stages: static
+        # parts, relationships and the zip's central directory.
+        timings.record("save", (time.perf_counter() - package_start) * 1000 - section_ms)
@@ -0,0 +1,95 @@
+# prerank.py
+"""
+Local BM25 pre-ranking of master resume items against a job posting.
+
+AISelector can forward only the top-K items of a long section (149 Core
+Competencies in data.json) to the model instead of all of them. Each item is
+a document; the job posting is the query. Items that share no terms with the
+posting score 0 and only fill the remaining slots, in their original order.
+
+Usage:
+    ranker = BM25Ranker(competencies)
+    candidates = ranker.top_k(job_posting, 40)   # original indices, in order
+"""
+
+import math
+import re
+from collections import Counter
+
+# Okapi BM25 parameters: term-frequency saturation and length normalization.
+K1 = 1.5
+B = 0.75
+
+# Keeps tech terms such as "c++", "c#", "node.js" and "ci/cd" whole.
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were will with
+you your we our their they who what which using use via into across over per such able ability
+""".split())
+
+
+def tokenize(text):
+    """Lowercase word tokens of text, without stopwords or trailing punctuation."""
+    tokens = []
+    for token in _TOKEN_RE.findall(str(text).lower()):
+        token = token.rstrip("./-")
+        if token and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def item_text(item):
+    """Searchable text of a resume item (a string or a dict of strings and lists)."""
+    if isinstance(item, dict):
+        return " ".join(item_text(value) for value in item.values())
+    if isinstance(item, (list, tuple)):
+        return " ".join(item_text(value) for value in item)
+    return str(item)
+
+
+class BM25Ranker:
+    def __init__(self, items):
+        """
+        items: the documents to rank, e.g. one section's content list. The
+               index is built once and reused for every query.
+        """
+        self._docs = [Counter(tokenize(item_text(item))) for item in items]
+        self._lengths = [sum(doc.values()) for doc in self._docs]
+        self._avg_length = (sum(self._lengths) / len(self._docs)) if self._docs else 0.0
+        document_frequency = Counter()
+        for doc in self._docs:
+            document_frequency.update(doc.keys())
+        n = len(self._docs)
+        self._idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+                     for term, df in document_frequency.items()}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def scores(self, query):
+        """BM25 score of every item against query, in item order."""
+        terms = [term for term in set(tokenize(query)) if term in self._idf]
+        scores = []
+        for doc, length in zip(self._docs, self._lengths):
+            norm = K1 * (1 - B + B * length / self._avg_length) if self._avg_length else K1
+            score = 0.0
+            for term in terms:
+                tf = doc.get(term)
+                if tf:
+                    score += self._idf[term] * tf * (K1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+    def top_k(self, query, k):
+        """
+        Original indices of the k best-scoring items, in their original order.
+
+        Ties (including items that do not match at all) go to the earlier
+        item. Returns every index when k >= len(items).
+        """
+        if k >= len(self._docs):
+            return list(range(len(self._docs)))
+        scores = self.scores(query)
+        best = sorted(range(len(scores)), key=lambda i: (-scores[i], i))[:max(0, k)]
+        return sorted(best)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+preview.py
+
+Fast text preview of the Harvard resume layout. Renders the compiled layout
+(see layout.py) as fixed-width text: name and section headers on their own
+lines, entry dates right-aligned, bullets indented like the 0.25" bullet
+indent, competencies on one wrapped line. The "ansi" style adds bold and
+underline for terminals.
+
+No python-docx import and no .docx build: a preview of data.json takes a
+fraction of a millisecond, so it suits the GUI, the CLI and batch QA checks.
+
+Usage:
+    python preview.py [resume.json ...] [--width N] [--style plain|ansi] [--pages]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from layout import compile_layout, NAME, CONTACT, HEADER, ENTRY, BODY, BULLET, INLINE_LIST, SPACER
+
+# Characters across the 7.5" text column at Times New Roman 11pt.
+DEFAULT_WIDTH = 100
+# The 18pt bullet indent, in characters.
+BULLET_INDENT = 4
+STYLES = ("plain", "ansi")
+
+_BOLD = "\x1b[1m"
+_UNDERLINE = "\x1b[4m"
+_RESET = "\x1b[0m"
+
+
+def _wrap(text, width):
+    """Greedy word wrap of text to width columns; always returns at least one line."""
+    text = " ".join(text.split())
+    lines = []
+    while len(text) > width:
+        cut = text.rfind(" ", 0, width + 1)
+        if cut <= 0:
+            # A word longer than the line is broken.
+            lines.append(text[:width])
+            text = text[width:]
+        else:
+            lines.append(text[:cut])
+            text = text[cut + 1:]
+    lines.append(text)
+    return lines
+
+
+def _contact_lines(items, width, ansi):
+    """Contact items joined by bullets, wrapping only between items."""
+    lines = []
+    plain_len = 0
+    parts = []
+    for text, url in items:
+        shown = f"{_UNDERLINE}{text}{_RESET}" if ansi and url else text
+        if parts and plain_len + 3 + len(text) > width:
+            lines.append("".join(parts))
+            parts, plain_len = [], 0
+        if parts:
+            parts.append(" • ")
+            plain_len += 3
+        parts.append(shown)
+        plain_len += len(text)
+    lines.append("".join(parts))
+    return lines
+
+
+def preview_layout(layout, width=DEFAULT_WIDTH, style="plain"):
+    """Render a compiled layout (layout.compile_layout) as preview text."""
+    if style not in STYLES:
+        raise ValueError(f"Unknown preview style {style!r}; expected one of: {', '.join(STYLES)}")
+    ansi = style == "ansi"
+    bold = (lambda s: f"{_BOLD}{s}{_RESET}") if ansi else (lambda s: s)
+    indent = " " * BULLET_INDENT
+    body_width = width - BULLET_INDENT
+    out = []
+
+    for _, blocks in layout:
+        for block in blocks:
+            kind = block[0]
+            if kind == NAME:
+                out.extend(bold(line) for line in _wrap(block[1], width))
+            elif kind == CONTACT:
+                out.extend(_contact_lines(block[1], width, ansi))
+            elif kind == HEADER:
+                if out and out[-1]:
+                    out.append("")
+                out.extend(bold(line) for line in _wrap(block[1], width))
+            elif kind == ENTRY:
+                title, date = block[1], block[2] or ""
+                lines = _wrap(title, width)
+                last = lines[-1]
+                out.extend(bold(line) for line in lines[:-1])
+                if date and len(last) + 1 + len(date) <= width:
+                    out.append(bold(last) + " " * (width - len(last) - len(date)) + date)
+                else:
+                    out.append(bold(last))
+                    if date:
+                        out.append(date.rjust(width))
+            elif kind == BODY:
+                out.extend(_wrap(block[1], width))
+            elif kind == BULLET:
+                lines = _wrap("• " + block[1], body_width)
+                out.extend(indent + line for line in lines)
+            elif kind == INLINE_LIST:
+                out.extend(indent + line for line in _wrap(", ".join(block[1]), body_width))
+            elif kind == SPACER:
+                out.append("")
+    while out and not out[-1]:
+        out.pop()
+    return "\n".join(out) + "\n"
+
+
+def preview(selected_sections, width=DEFAULT_WIDTH, style="plain"):
+    """
+    Return a text preview of selected_sections as Generator would lay it out.
+
+    width: characters per line (the full text column).
+    style: "plain" or "ansi" (bold name, headers and entry titles;
+           underlined links).
+    """
+    return preview_layout(compile_layout(selected_sections), width, style)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a fast text preview of a resume JSON file.")
+    parser.add_argument("files", nargs="*", help="Resume JSON files (default: data.json next to this script)")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH, help="Characters per line")
+    parser.add_argument("--style", choices=STYLES, default=None,
+                        help="Output style (default: ansi on a terminal, plain otherwise)")
+    parser.add_argument("--pages", action="store_true", help="Also print the estimated page count")
+    args = parser.parse_args()
+
+    style = args.style or ("ansi" if sys.stdout.isatty() else "plain")
+    files = args.files or [os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.json")]
+    for i, path in enumerate(files):
+        with open(path, "r") as f:
+            selected_sections = json.load(f)
+        if len(files) > 1:
+            if i:
+                print()
+            print(f"==> {path} <==")
+        sys.stdout.write(preview(selected_sections, args.width, style))
+        if args.pages:
+            from layout_estimate import estimate_pages
+            print(f"\n[estimated {estimate_pages(selected_sections):.2f} pages]")
+
+
+if __name__ == "__main__":
+    main()
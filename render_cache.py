@@ -0,0 +1,206 @@
+# render_cache.py
+"""
+Content-addressed, size-bounded cache of rendered resumes.
+
+Each rendered .docx is stored under a SHA-256 of the generator's layout
+version and the selected_sections it was rendered from, so identical
+selections are rendered once and served from disk afterwards. Entries are
+evicted least-recently-used first once the cache grows past max_bytes,
+down to EVICT_TO of it. The use order is kept in memory, seeded from the
+files' mtimes when the cache is opened; a hit also refreshes the mtime so
+the order survives a restart.
+
+Usage:
+    cache = RenderCache("~/.cache/resume-generator")
+    Generator(selected_sections, cache=cache).generate("Resume.docx")
+    print(cache.stats())
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Fraction of max_bytes eviction shrinks the cache to, so a full cache does
+# not evict on every put.
+EVICT_TO = 0.9
+
+
+def stable_hash(value):
+    """Return a hex SHA-256 of a JSON-serializable value, independent of dict key order."""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def write_replacing(path, write):
+    """
+    Call write(f) with a binary file opened next to path, then move that
+    file over path. path is replaced rather than written in place, so a file
+    hardlinked to it (a RenderCache entry after a hardlink hit) never
+    changes.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class RenderCache:
+    # File extension of cache entries; subclasses storing other payloads override it.
+    SUFFIX = ".docx"
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, hardlink=False):
+        """
+        directory: where cached .docx files live (created if missing).
+        max_bytes: total size the cache may occupy before LRU eviction.
+        hardlink:  on a hit, hardlink the cached file to the output path instead
+                   of copying it. Faster and uses no extra space, but the output
+                   then shares its inode with the cache entry, so edit it only
+                   through tools that replace files rather than write in place
+                   (Generator always replaces its outputs).
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self.hardlink = hardlink
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(self.SUFFIX)], stat.st_size))
+        # key -> size, least recently used first.
+        self._sizes = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._bytes = sum(self._sizes.values())
+
+    def __getstate__(self):
+        # Locks don't pickle; pool workers rebuild their own state in __setstate__.
+        return {"directory": self.directory, "max_bytes": self.max_bytes, "hardlink": self.hardlink}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"], state["max_bytes"], state["hardlink"])
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}{self.SUFFIX}")
+
+    def lookup(self, key):
+        """Return the cached file path for key (marking it recently used), or None."""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+                self._forget(key)
+            return None
+        with self._lock:
+            self.hits += 1
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        return path
+
+    def get(self, key):
+        """Return the cached bytes for key, or None on a miss."""
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:  # evicted by another process in between
+            return None
+
+    def put(self, key, data):
+        """Store rendered bytes under key and evict old entries if over budget."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        with self._lock:
+            self._forget(key)
+            self._sizes[key] = len(data)
+            self._bytes += len(data)
+        self._evict()
+        return self._path(key)
+
+    def copy_to(self, key, output_file):
+        """
+        Write the cached entry for key to output_file (a path or binary stream).
+        Returns False if the entry is missing.
+        """
+        if hasattr(output_file, "write"):
+            data = self.get(key)
+            if data is None:
+                return False
+            output_file.write(data)
+            return True
+
+        path = self.lookup(key)
+        if path is None:
+            return False
+        try:
+            if self.hardlink:
+                tmp_path = f"{output_file}.{os.getpid()}.tmp"
+                os.link(path, tmp_path)
+                os.replace(tmp_path, output_file)
+            else:
+                self._copy(path, output_file)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # Cross-device or unsupported hardlink: fall back to a plain copy.
+            self._copy(path, output_file)
+        return True
+
+    @staticmethod
+    def _copy(path, output_file):
+        # Replace output_file rather than copying into it: it may be a
+        # hardlink to another cache entry.
+        with open(path, "rb") as src:
+            write_replacing(output_file, lambda f: shutil.copyfileobj(src, f))
+
+    def _forget(self, key):
+        # Callers hold self._lock.
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self):
+        with self._lock:
+            if self._bytes <= self.max_bytes:
+                return
+            target = self.max_bytes * EVICT_TO
+            while self._sizes and self._bytes > target:
+                key, size = self._sizes.popitem(last=False)
+                self._bytes -= size
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    continue
+                self.evictions += 1
+
+    def stats(self):
+        """Return hit/miss/eviction counters and current size as a dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._sizes),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,97 @@
+# render_timings.py
+"""
+Stage-level instrumentation for Generator renders.
+
+Pass a RenderTimings to Generator(..., timings=...) to record, for every
+render, the wall time of each stage (cache lookup, base document, each
+section by title, save) plus the paragraphs and runs each section produced.
+Records can be exported as JSON and aggregated across batch runs.
+
+Usage:
+    timings = RenderTimings()
+    Generator(selected_sections, timings=timings).generate("Resume.docx")
+    print(timings.to_json(indent=2))
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+
+class RenderTimings:
+    def __init__(self, on_render=None):
+        """
+        on_render: optional callable(record_dict) invoked after each render,
+                   e.g. to stream records to a log instead of keeping them.
+        """
+        self.on_render = on_render
+        self.renders = []
+        self._current = None
+        self._started = None
+
+    def start_render(self, **info):
+        """Begin a render record; info (backend, lean, ...) is stored on it."""
+        self._current = dict(info, stages=[])
+        self._started = time.perf_counter()
+
+    def finish_render(self, **info):
+        """Close the current render record and hand it to on_render."""
+        record = self._current
+        if record is None:
+            return
+        record.update(info)
+        record["total_ms"] = (time.perf_counter() - self._started) * 1000
+        self.renders.append(record)
+        self._current = None
+        if self.on_render:
+            self.on_render(record)
+
+    @contextmanager
+    def stage(self, name, **info):
+        """
+        Time the enclosed block as one stage of the current render. Yields the
+        stage dict so the caller can attach counts (paragraphs, runs).
+        """
+        entry = dict(name=name, **info)
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["ms"] = (time.perf_counter() - start) * 1000
+            if self._current is not None:
+                self._current["stages"].append(entry)
+
+    def record(self, name, ms, **info):
+        """Add a stage measured by the caller to the current render."""
+        if self._current is not None:
+            self._current["stages"].append(dict(name=name, ms=ms, **info))
+
+    def summary(self):
+        """
+        Aggregate stages across all recorded renders. Sections are keyed as
+        "section:<title>". Returns {key: {count, total_ms, mean_ms, max_ms,
+        paragraphs, runs}}.
+        """
+        totals = {}
+        for record in self.renders:
+            for entry in record["stages"]:
+                key = entry["name"]
+                if "title" in entry:
+                    key = f"{key}:{entry['title']}"
+                agg = totals.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                              "paragraphs": 0, "runs": 0})
+                agg["count"] += 1
+                agg["total_ms"] += entry["ms"]
+                agg["max_ms"] = max(agg["max_ms"], entry["ms"])
+                agg["paragraphs"] += entry.get("paragraphs", 0)
+                agg["runs"] += entry.get("runs", 0)
+        for agg in totals.values():
+            agg["mean_ms"] = agg["total_ms"] / agg["count"]
+        return totals
+
+    def to_dict(self):
+        return {"renders": self.renders, "summary": self.summary()}
+
+    def to_json(self, **kwargs):
+        """Serialize all render records plus the summary; kwargs go to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
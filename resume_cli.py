@@ -11,15 +11,37 @@ Usage:
 Arguments:
     output_path     Path for the generated .docx file
     job_posting     Job posting text (as a string)
+
+Options:
+    --two-round         Separate select and reorder AI calls (default: one combined call)
+    --top-k K           Send only the K best locally ranked projects/competencies to the AI
+    --offline           Select items locally without contacting the AI (needs NumPy)
+    --mock-ai           Answer AI calls with the local mock backend (for CI and load tests)
+    --hedge MODELS      Race a request across comma-separated models, fastest first
+    --hedge-delay SEC   Seconds before each further hedged model is launched
+    --cache-dir DIR     Reuse previously rendered resumes for identical selections
+    --ai-cache-dir DIR  Reuse AI responses for postings already processed
+    --lean              Build on a minimal .docx template (smaller, faster to save)
+    --fit-pages N       Drop the least relevant projects/competencies to fit N pages
+    --also FORMAT       Also write txt, md or html next to the .docx (repeatable)
+    --preview           Print a text preview of the generated resume
+    --compression MODE  Zip compression of the .docx: stored, fast, default or max
+    --backend NAME      Render backend: docx (python-docx) or ooxml (direct XML, faster)
 """
 
 import argparse
 import json
 import os
 import sys
+import threading
 
-from ai_selector import AISelector
-from generator import Generator
+from ai_backends import MockBackend
+from ai_cache import ResponseCache, DEFAULT_TTL
+from ai_selector import AISelector, DEFAULT_HEDGE_DELAY
+from generator import Generator, BACKENDS, OUTPUT_FORMATS, COMPRESSION_MODES
+from offline_selector import OfflineSelector
+from preview import preview_layout
+from render_cache import RenderCache, DEFAULT_MAX_BYTES
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -35,6 +57,14 @@ def load_data():
     sys.exit(1)
 
 
+def prerender(selected_sections, **options):
+    """Render and discard a partial resume to warm the base document and section caches."""
+    try:
+        Generator(selected_sections, **options).generate_bytes()
+    except Exception:
+        pass  # only a warm-up; the real render reports errors
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate a tailored resume using AI to select the best options."
@@ -46,43 +76,197 @@ def main():
         default=None,
         help="Claude model to use (e.g., sonnet, opus, haiku)",
     )
+    parser.add_argument(
+        "--two-round",
+        action="store_true",
+        help="Select and then reorder in two AI calls instead of one combined call",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Select items with the deterministic offline scorer instead of the AI",
+    )
+    parser.add_argument(
+        "--mock-ai",
+        action="store_true",
+        help="Answer AI calls with the in-process mock backend instead of Claude",
+    )
+    parser.add_argument(
+        "--hedge",
+        default=None,
+        metavar="MODELS",
+        help="Hedge AI requests across comma-separated models, fastest first (e.g. haiku,sonnet)",
+    )
+    parser.add_argument(
+        "--hedge-delay",
+        type=float,
+        default=DEFAULT_HEDGE_DELAY,
+        metavar="SEC",
+        help="Seconds before launching the next hedged model (0 launches all at once)",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Pre-rank projects and competencies locally and send only the top K of each to the AI",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the rendered-resume cache (disabled when omitted)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Size limit of the rendered-resume cache in MB",
+    )
+    parser.add_argument(
+        "--ai-cache-dir",
+        default=None,
+        help="Directory for the AI response cache (disabled when omitted)",
+    )
+    parser.add_argument(
+        "--ai-cache-ttl-days",
+        type=float,
+        default=DEFAULT_TTL / 86400,
+        help="Days a cached AI response stays valid",
+    )
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="Build on a minimal .docx template for smaller files and faster saves",
+    )
+    parser.add_argument(
+        "--fit-pages",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Trim the least relevant projects and competencies until the resume fits on N pages",
+    )
+    parser.add_argument(
+        "--also",
+        action="append",
+        default=[],
+        choices=[fmt for fmt in OUTPUT_FORMATS if fmt != "docx"],
+        metavar="FORMAT",
+        help="Also write the resume as txt, md or html next to the .docx (repeatable)",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSION_MODES),
+        default="default",
+        help="Zip compression of the .docx package (stored skips deflate; max is smallest)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="docx",
+        help="Render backend: docx builds through python-docx, ooxml writes the XML directly (faster)",
+    )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Print a text preview of the generated resume",
+    )
     args = parser.parse_args()
 
     master_resume = load_data()
     print(f"Output: {args.output_path}")
 
-    selector = AISelector(master_resume)
-    result, error = selector.call_with_retry(
-        args.job_posting, model=args.model, on_progress=print
+    ai_cache = None
+    if args.ai_cache_dir:
+        ai_cache = ResponseCache(args.ai_cache_dir, ttl=args.ai_cache_ttl_days * 86400)
+
+    selector_class = OfflineSelector if args.offline else AISelector
+    hedge_models = [m.strip() for m in args.hedge.split(",") if m.strip()] if args.hedge else None
+    selector = selector_class(master_resume, cache=ai_cache, top_k=args.top_k,
+                              hedge_models=hedge_models, hedge_delay=args.hedge_delay,
+                              backend=MockBackend(seed=0) if args.mock_ai else None)
+
+    # Once the objective and projects have streamed in, render everything but
+    # the competencies in the background so the final render only adds them.
+    warmup = []
+
+    def on_partial(partial):
+        if warmup or "objective_index" not in partial or len(partial.get("technical_project_indices", ())) < 2:
+            return
+        sections = selector.build_selected_sections(dict(partial, core_competency_indices=[]))
+        thread = threading.Thread(target=prerender, args=(sections,), daemon=True,
+                                  kwargs={"lean": args.lean, "compression": args.compression,
+                                          "backend": args.backend})
+        thread.start()
+        warmup.append(thread)
+
+    result, reorder, error = selector.select(
+        args.job_posting, model=args.model, on_progress=print, single_round=not args.two_round,
+        on_partial=on_partial,
     )
+    for thread in warmup:
+        thread.join()
 
     if error:
         print(f"\nError: {error}", file=sys.stderr)
         sys.exit(1)
 
-    # Build the selected items for the reorder prompt
-    projects = selector._get_section_content("Technical Projects")
-    competencies = selector._get_section_content("Core Competencies")
-    selected_projects = [projects[i] for i in result["technical_project_indices"]]
-    selected_comps = [competencies[i] for i in result["core_competency_indices"]]
-
-    reorder, reorder_error = selector.call_reorder(
-        args.job_posting, selected_projects, selected_comps,
-        model=args.model, on_progress=print
-    )
-    if reorder_error:
-        print(f"\nReorder warning: {reorder_error}", file=sys.stderr)
-        print("Proceeding with default order.", file=sys.stderr)
-
     selected_sections = selector.build_selected_sections(result, reorder=reorder)
 
+    cache = None
+    if args.cache_dir:
+        cache = RenderCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
     try:
-        Generator(selected_sections).generate(args.output_path)
+        generator = Generator(selected_sections, cache=cache, lean=args.lean, fit_pages=args.fit_pages,
+                              compression=args.compression, backend=args.backend)
+        stem = os.path.splitext(args.output_path)[0]
+        outputs = {"docx": args.output_path}
+        outputs.update((fmt, f"{stem}.{fmt}") for fmt in args.also)
+        generator.generate_formats(outputs)
     except Exception as e:
         print(f"Error generating document: {e}", file=sys.stderr)
         sys.exit(1)
 
+    report = generator.fit_report
+    if report:
+        print(f"Fit to {args.fit_pages} page(s): removed {len(report['removed_projects'])} project(s) "
+              f"and {len(report['removed_competencies'])} competency item(s); "
+              f"estimated {report['pages']:.2f} pages")
+        if not report["fits"]:
+            print("Warning: the resume still exceeds the page limit at the minimum selection.",
+                  file=sys.stderr)
+
+    if args.preview:
+        style = "ansi" if sys.stdout.isatty() else "plain"
+        print()
+        print(preview_layout(generator.layout(), style=style), end="")
+
+    prompts = selector.prompt_stats()
+    if prompts["prompts"]:
+        line = (f"Prompts: {prompts['prompts']} sent, {prompts['prefix_chars']} chars in the cacheable "
+                f"prefix, {prompts['fresh_chars']} chars fresh")
+        if prompts["input_tokens"] or prompts["cache_read_input_tokens"]:
+            line += (f"; tokens: {prompts['cache_read_input_tokens']} cache read, "
+                     f"{prompts['cache_creation_input_tokens']} cache write, "
+                     f"{prompts['input_tokens']} uncached")
+        print(line)
+        invalid = prompts["repaired"] + prompts["rejected"]
+        if invalid:
+            print(f"Repaired {prompts['repaired']} of {invalid} invalid AI response(s) locally "
+                  f"({prompts['repaired']} round trip(s) saved)")
+        latency = selector.latency_stats()
+        winners = ", ".join(f"{model} {count}" for model, count in latency["winners"].items())
+        print(f"AI latency: {latency['calls']} call(s), p50 {latency['p50_ms']:.0f} ms, "
+              f"p99 {latency['p99_ms']:.0f} ms" + (f"; answered by {winners}" if winners else ""))
+    if ai_cache:
+        stats = ai_cache.stats()
+        print(f"AI cache: {stats['hits']} hit(s), {stats['misses']} miss(es)")
+    if cache:
+        print("Render cache: hit" if cache.hits else "Render cache: miss (stored)")
+
     print(f"\nResume generated: {os.path.abspath(args.output_path)}")
+    for fmt in args.also:
+        print(f"Also written: {os.path.abspath(outputs[fmt])}")
 
 
 if __name__ == "__main__":
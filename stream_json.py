@@ -0,0 +1,144 @@
+# stream_json.py
+"""
+Incremental parsing of one JSON object from streamed model output.
+
+AISelector feeds the text deltas of a streaming response into a
+StreamingJSONObject. Each top-level field is decoded as soon as its value is
+closed, so callers can act on "objective_index" before the rest of the
+object has arrived, and the stream can be abandoned the moment the object
+is complete or the text can no longer become valid JSON.
+
+Text before the opening brace (a ```json fence, a stray sentence) is
+skipped; text after the closing brace is ignored.
+
+Usage:
+    obj = StreamingJSONObject(on_field=lambda key, value, fields: ...)
+    for chunk in chunks:
+        obj.feed(chunk)
+        if obj.complete or obj.error:
+            break
+    json.loads(obj.text)
+"""
+
+import json
+
+# Characters skipped before the opening brace before the text is rejected.
+MAX_PREAMBLE = 200
+
+_WHITESPACE = " \t\r\n"
+
+
+class StreamingJSONObject:
+    def __init__(self, on_field=None, max_preamble=MAX_PREAMBLE):
+        """
+        on_field: optional callable(key, value, fields) called once per
+                  top-level field as soon as its value is complete; fields
+                  holds every field decoded so far.
+        max_preamble: characters allowed before the opening brace.
+        """
+        self.on_field = on_field
+        self.max_preamble = max_preamble
+        self.fields = {}
+        self.complete = False
+        self.error = None
+        self.trailing = False  # text arrived after the closing brace
+        self._text = []      # object text consumed so far, from the opening brace
+        self._length = 0
+        self._preamble = 0
+        self._state = "preamble"  # preamble, key, colon, value, done
+        self._nesting = []  # open brackets inside the current value
+        self._in_string = False
+        self._escape = False
+        self._token_start = 0
+        self._key = None
+
+    @property
+    def text(self):
+        """The object text received so far (complete once self.complete is set)."""
+        return "".join(self._text)
+
+    def feed(self, chunk):
+        """Consume the next piece of streamed text; stops at completion or the first error."""
+        for ch in chunk:
+            if self.complete or self.error:
+                self.trailing = self.complete
+                return
+            if self._state == "preamble":
+                if ch == "{":
+                    self._append(ch)
+                    self._state = "key"
+                else:
+                    self._preamble += 1
+                    if self._preamble > self.max_preamble:
+                        self.error = "no JSON object in the response"
+                continue
+            self._append(ch)
+            self._step(ch)
+
+    def _append(self, ch):
+        self._text.append(ch)
+        self._length += 1
+
+    def _step(self, ch):
+        position = self._length - 1
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                if self._state == "key":
+                    self._key = json.loads(self.text[self._token_start:position + 1])
+                    self._state = "colon"
+            return
+
+        state = self._state
+        if state == "key":
+            if ch == '"' and self._key is None:
+                self._in_string = True
+                self._token_start = position
+            elif ch == "}" and self._key is None and not self.fields:
+                self._finish()
+            elif ch not in _WHITESPACE:
+                self.error = f"expected a field name, got {ch!r}"
+        elif state == "colon":
+            if ch == ":":
+                self._state = "value"
+                self._token_start = position + 1
+            elif ch not in _WHITESPACE:
+                self.error = f"expected ':' after {self._key!r}, got {ch!r}"
+        elif state == "value":
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._nesting.append("}" if ch == "{" else "]")
+            elif ch in "}]" and self._nesting:
+                if self._nesting.pop() != ch:
+                    self.error = f"mismatched {ch!r} in {self._key!r}"
+            elif ch in ",}" and not self._nesting:
+                self._end_value(position)
+                if self.error:
+                    return
+                if ch == ",":
+                    self._state = "key"
+                else:
+                    self._finish()
+            elif ch == "]":
+                self.error = f"unbalanced ']' in {self._key!r}"
+
+    def _end_value(self, position):
+        raw = self.text[self._token_start:position]
+        try:
+            value = json.loads(raw)
+        except ValueError as e:
+            self.error = f"invalid value for {self._key!r}: {e}"
+            return
+        key, self._key = self._key, None
+        self.fields[key] = value
+        if self.on_field:
+            self.on_field(key, value, dict(self.fields))
+
+    def _finish(self):
+        self._state = "done"
+        self.complete = True
@@ -0,0 +1,148 @@
+# text_formats.py
+"""
+Plain text, Markdown and HTML backends for the compiled resume layout.
+
+Each renderer takes the (title, blocks) list from layout.compile_layout()
+and returns a str, so one compiled layout can feed the .docx backends and
+any of these in the same pass (see Generator.generate_formats).
+
+    render_text      ATS-friendly plain text
+    render_markdown  Markdown with links for contact items
+    render_html      standalone HTML page styled after the Harvard layout
+"""
+
+import html
+
+from layout import NAME, CONTACT, HEADER, ENTRY, BODY, BULLET, INLINE_LIST, SPACER
+
+CONTACT_SEPARATOR = " • "
+
+def render_text(layout):
+    """Plain text for applicant tracking systems: one line per paragraph, no markup."""
+    lines = []
+    for _, blocks in layout:
+        for block in blocks:
+            kind = block[0]
+            if kind == CONTACT:
+                lines.append(CONTACT_SEPARATOR.join(text for text, _ in block[1]))
+            elif kind == ENTRY:
+                lines.append(block[1] if block[2] is None else f"{block[1]}\t{block[2]}")
+            elif kind == BULLET:
+                lines.append("• " + block[1])
+            elif kind == INLINE_LIST:
+                lines.append(", ".join(block[1]))
+            elif kind == SPACER:
+                lines.append("")
+            elif kind == HEADER:
+                if lines and lines[-1]:
+                    lines.append("")
+                lines.append(block[1])
+            else:  # NAME, BODY
+                lines.append(block[1])
+    return "\n".join(lines).rstrip("\n") + "\n"
+
+_MARKDOWN_SPECIAL = str.maketrans({ch: "\\" + ch for ch in "\\`*_[]<>#|"})
+
+def _md(text):
+    return text.translate(_MARKDOWN_SPECIAL)
+
+def render_markdown(layout):
+    """Markdown: name as the title, sections as level-2 headings, details as lists."""
+    out = []
+
+    def paragraph(text):
+        # Blank line before every non-list paragraph, as Markdown requires.
+        if out and out[-1] != "":
+            out.append("")
+        out.append(text)
+
+    for _, blocks in layout:
+        for block in blocks:
+            kind = block[0]
+            if kind == NAME:
+                paragraph(f"# {_md(block[1])}")
+            elif kind == CONTACT:
+                paragraph(CONTACT_SEPARATOR.join(
+                    f"[{_md(text)}]({url})" if url else _md(text) for text, url in block[1]))
+            elif kind == HEADER:
+                paragraph(f"## {_md(block[1])}")
+            elif kind == ENTRY:
+                date = f" — {_md(block[2])}" if block[2] else ""
+                paragraph(f"**{_md(block[1])}**{date}")
+            elif kind == BODY:
+                paragraph(_md(block[1]))
+            elif kind == BULLET:
+                if out and out[-1] != "" and not out[-1].startswith("- "):
+                    out.append("")
+                out.append(f"- {_md(block[1])}")
+            elif kind == INLINE_LIST:
+                paragraph(_md(", ".join(block[1])))
+            elif kind == SPACER and out and out[-1] != "":
+                out.append("")
+    return "\n".join(out).rstrip("\n") + "\n"
+
+_HTML_STYLE = (
+    "body{font-family:'Times New Roman',Times,serif;font-size:11pt;max-width:7.5in;margin:0.5in auto}"
+    "h1{font-size:16pt;margin:0}"
+    ".contact{margin:0 0 6pt}"
+    "h2{font-size:12pt;margin:12pt 0 6pt}"
+    ".entry{display:flex;justify-content:space-between;margin:6pt 0 0}"
+    ".entry b{margin-right:1em}"
+    "p{margin:0}"
+    "ul{margin:0;padding-left:18pt;list-style:none}"
+    "li::before{content:'• '}"
+    ".list{padding-left:18pt}"
+    ".spacer{height:6pt}"
+    "a{color:#000}"
+)
+
+def render_html(layout, title=None):
+    """
+    Standalone HTML page. title sets the document <title>; by default the
+    name from Personal Information is used.
+    """
+    esc = html.escape
+    body = []
+    in_list = False
+    for _, blocks in layout:
+        for block in blocks:
+            kind = block[0]
+            if in_list and kind != BULLET:
+                body.append("</ul>")
+                in_list = False
+            if kind == NAME:
+                title = block[1] if title is None else title
+                body.append(f"<h1>{esc(block[1])}</h1>")
+            elif kind == CONTACT:
+                items = (f'<a href="{esc(url)}">{esc(text)}</a>' if url else esc(text) for text, url in block[1])
+                body.append(f'<p class="contact">{CONTACT_SEPARATOR.join(items)}</p>')
+            elif kind == HEADER:
+                body.append(f"<h2>{esc(block[1])}</h2>")
+            elif kind == ENTRY:
+                date = f"<span>{esc(block[2])}</span>" if block[2] else ""
+                body.append(f'<div class="entry"><b>{esc(block[1])}</b>{date}</div>')
+            elif kind == BODY:
+                body.append(f"<p>{esc(block[1])}</p>")
+            elif kind == BULLET:
+                if not in_list:
+                    body.append("<ul>")
+                    in_list = True
+                body.append(f"<li>{esc(block[1])}</li>")
+            elif kind == INLINE_LIST:
+                body.append(f'<p class="list">{esc(", ".join(block[1]))}</p>')
+            elif kind == SPACER:
+                body.append('<div class="spacer"></div>')
+    if in_list:
+        body.append("</ul>")
+    return (
+        '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+        f"<title>{esc(title or 'Resume')}</title><style>{_HTML_STYLE}</style></head>\n"
+        "<body>\n" + "\n".join(body) + "\n</body></html>\n"
+    )
+
+# Output formats besides .docx, by file extension.
+RENDERERS = {
+    "txt": render_text,
+    "md": render_markdown,
+    "html": render_html,
+}